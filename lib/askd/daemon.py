@@ -206,6 +206,9 @@ class UnifiedAskDaemon:
         import askd_rpc
 
         self.registry.start_all()
+        # Adapter modules are imported in the background so the server binds and publishes
+        # its state file right away; a request for a provider not built yet builds it inline.
+        threading.Thread(target=self.registry.warm_up, name="askd-adapter-warmup", daemon=True).start()
 
         def _on_stop() -> None:
             self.registry.stop_all()
@@ -232,13 +235,6 @@ class UnifiedAskDaemon:
         try:
             if isinstance(st, dict) and int(st.get("pid") or 0) == os.getpid():
                 self.state_file.unlink(missing_ok=True)
-        except TypeError:
-            try:
-                if isinstance(st, dict) and int(st.get("pid") or 0) == os.getpid():
-                    if self.state_file.exists():
-                        self.state_file.unlink()
-            except Exception:
-                pass
         except Exception:
             pass
 
@@ -4,7 +4,7 @@ Provider registry for the unified ask daemon.
 from __future__ import annotations
 
 import threading
-from typing import Dict, Optional, Type
+from typing import Callable, Dict, Optional, Type
 
 from askd.adapters.base import BaseProviderAdapter
 
@@ -18,39 +18,100 @@ class ProviderRegistry:
 
     def __init__(self):
         self._lock = threading.Lock()
+        # Serializes factory calls (module imports) without blocking plain lookups.
+        self._build_lock = threading.Lock()
         self._adapters: Dict[str, BaseProviderAdapter] = {}
+        self._factories: Dict[str, Callable[[], BaseProviderAdapter]] = {}
+        self._started = False
+        # Set by stop_all(): lazy adapters are no longer built (or started) after shutdown.
+        self._stopped = False
 
     def register(self, adapter: BaseProviderAdapter) -> None:
         """Register a provider adapter."""
         with self._lock:
+            self._factories.pop(adapter.key, None)
             self._adapters[adapter.key] = adapter
 
+    def register_lazy(self, key: str, factory: Callable[[], BaseProviderAdapter]) -> None:
+        """Register a provider whose adapter is built by `factory` on first use."""
+        with self._lock:
+            if key not in self._adapters:
+                self._factories[key] = factory
+
     def get(self, key: str) -> Optional[BaseProviderAdapter]:
         """Get a provider adapter by key."""
         with self._lock:
-            return self._adapters.get(key)
+            adapter = self._adapters.get(key)
+            if adapter is not None or key not in self._factories:
+                return adapter
+        return self._build(key)
+
+    def _build(self, key: str) -> Optional[BaseProviderAdapter]:
+        # on_start runs under _build_lock too, so stop_all() (which takes it after setting
+        # _stopped) never overtakes a build that is still starting its adapter.
+        with self._build_lock:
+            with self._lock:
+                adapter = self._adapters.get(key)
+                factory = self._factories.get(key)
+                stopped = self._stopped
+            if adapter is not None or factory is None or stopped:
+                return adapter
+            adapter = factory()
+            with self._lock:
+                if self._stopped:
+                    return None
+                self._factories.pop(key, None)
+                self._adapters[key] = adapter
+                started = self._started
+            if started:
+                try:
+                    adapter.on_start()
+                except Exception:
+                    pass
+        return adapter
 
     def keys(self) -> list[str]:
         """Get all registered provider keys."""
         with self._lock:
-            return list(self._adapters.keys())
+            return list(self._adapters.keys()) + [k for k in self._factories if k not in self._adapters]
 
     def all(self) -> list[BaseProviderAdapter]:
-        """Get all registered adapters."""
+        """Get all registered adapters, building any that are still lazy."""
+        self.warm_up()
         with self._lock:
             return list(self._adapters.values())
 
+    def warm_up(self) -> None:
+        """Build every lazily registered adapter now."""
+        with self._lock:
+            pending = [] if self._stopped else list(self._factories)
+        for key in pending:
+            try:
+                self._build(key)
+            except Exception:
+                pass
+
     def start_all(self) -> None:
-        """Call on_start for all adapters."""
-        for adapter in self.all():
+        """Call on_start for all built adapters; lazy ones get it when they are built."""
+        with self._lock:
+            self._started = True
+            built = list(self._adapters.values())
+        for adapter in built:
             try:
                 adapter.on_start()
             except Exception:
                 pass
 
     def stop_all(self) -> None:
-        """Call on_stop for all adapters."""
-        for adapter in self.all():
+        """Call on_stop for all built adapters; lazy ones still pending are never built."""
+        with self._lock:
+            self._started = False
+            self._stopped = True
+        # Wait out a build that is already running so its adapter is stopped below.
+        with self._build_lock:
+            with self._lock:
+                built = list(self._adapters.values())
+        for adapter in built:
             try:
                 adapter.on_stop()
             except Exception:
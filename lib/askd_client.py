@@ -3,7 +3,6 @@ from __future__ import annotations
 import json
 import os
 import shutil
-import socket
 import subprocess
 import sys
 import time
@@ -15,7 +14,7 @@ from providers import ProviderClientSpec
 from session_utils import find_project_session_file
 from project_id import compute_ccb_project_id
 from pane_registry import load_registry_by_project_id
-from askd_rpc import CCBTimeoutError, _recv_with_deadline
+from askd_rpc import CCBTimeoutError, _recv_with_deadline, connect_daemon
 
 
 def resolve_work_dir(
@@ -191,8 +190,7 @@ def try_daemon_request(
     if not st:
         return None
     try:
-        host = st.get("connect_host") or st.get("host")
-        port = int(st["port"])
+        int(st["port"])
         token = st["token"]
     except Exception:
         return None
@@ -229,7 +227,7 @@ def try_daemon_request(
             connect_timeout = min(2.0, max(0.1, float(timeout)))
             deadline = time.time() + float(timeout)
 
-        with socket.create_connection((host, port), timeout=connect_timeout) as sock:
+        with connect_daemon(st, connect_timeout) as sock:
             sock.sendall((json.dumps(payload, ensure_ascii=False) + "\n").encode("utf-8"))
             # Use shared helper with larger bufsize for request responses
             buf = _recv_with_deadline(sock, deadline, bufsize=65536)
@@ -291,16 +289,20 @@ def wait_for_daemon_ready(spec: ProviderClientSpec, timeout_s: float = 2.0, stat
         ping_daemon = getattr(daemon_module, "ping_daemon")
     except Exception:
         return False
-    deadline = time.time() + max(0.1, float(timeout_s))
+    deadline = time.monotonic() + max(0.1, float(timeout_s))
     if state_file is None:
         state_file = state_file_from_env(spec.state_file_env)
-    while time.time() < deadline:
+    # A freshly spawned daemon usually answers within tens of ms: start with short sleeps
+    # and back off to the old 100 ms cadence.
+    delay = 0.01
+    while time.monotonic() < deadline:
         try:
             if ping_daemon(timeout_s=0.2, state_file=state_file):
                 return True
         except Exception:
             pass
-        time.sleep(0.1)
+        time.sleep(delay)
+        delay = min(delay * 2, 0.1)
     return False
 
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import os
 import socket
 import time
 from pathlib import Path
@@ -11,11 +12,27 @@ class CCBTimeoutError(TimeoutError):
     pass
 
 
+# state file -> ((st_ino, st_mtime_ns, st_size), parsed state). The daemon swaps its state
+# file in with os.replace, so any rewrite changes the key; ping + connect reuse one parse.
+_STATE_CACHE: dict[str, tuple[tuple[int, int, int], dict]] = {}
+_STATE_CACHE_MAX = 32
+
+
 def read_state(state_file: Path) -> dict | None:
     try:
-        raw = state_file.read_text(encoding="utf-8")
+        st = os.stat(state_file)
+        key = (int(st.st_ino), int(st.st_mtime_ns), int(st.st_size))
+        cached = _STATE_CACHE.get(str(state_file))
+        if cached is not None and cached[0] == key:
+            return dict(cached[1])
+        raw = Path(state_file).read_text(encoding="utf-8")
         obj = json.loads(raw)
-        return obj if isinstance(obj, dict) else None
+        if not isinstance(obj, dict):
+            return None
+        if len(_STATE_CACHE) >= _STATE_CACHE_MAX:
+            _STATE_CACHE.clear()
+        _STATE_CACHE[str(state_file)] = (key, obj)
+        return dict(obj)
     except Exception:
         return None
 
@@ -60,19 +77,33 @@ def _recv_with_deadline(
     return buf
 
 
+def connect_daemon(st: dict, timeout: float) -> socket.socket:
+    """Connect to a daemon described by its state file, preferring its local unix socket."""
+    unix_path = st.get("unix_socket")
+    if unix_path and hasattr(socket, "AF_UNIX"):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.settimeout(timeout)
+            sock.connect(str(unix_path))
+            return sock
+        except OSError:
+            sock.close()
+    host = st.get("connect_host") or st["host"]
+    return socket.create_connection((host, int(st["port"])), timeout=timeout)
+
+
 def ping_daemon(protocol_prefix: str, timeout_s: float, state_file: Path) -> bool:
     st = read_state(state_file)
     if not st:
         return False
     try:
-        host = st.get("connect_host") or st["host"]
-        port = int(st["port"])
+        int(st["port"])
         token = st["token"]
     except Exception:
         return False
     try:
         deadline = time.time() + timeout_s
-        with socket.create_connection((host, port), timeout=min(timeout_s, 2.0)) as sock:
+        with connect_daemon(st, min(timeout_s, 2.0)) as sock:
             req = {"type": f"{protocol_prefix}.ping", "v": 1, "id": "ping", "token": token}
             sock.sendall((json.dumps(req) + "\n").encode("utf-8"))
             buf = _recv_with_deadline(sock, deadline, bufsize=1024)
@@ -92,14 +123,13 @@ def shutdown_daemon(protocol_prefix: str, timeout_s: float, state_file: Path) ->
     if not st:
         return False
     try:
-        host = st.get("connect_host") or st["host"]
-        port = int(st["port"])
+        int(st["port"])
         token = st["token"]
     except Exception:
         return False
     try:
         deadline = time.time() + timeout_s
-        with socket.create_connection((host, port), timeout=min(timeout_s, 2.0)) as sock:
+        with connect_daemon(st, min(timeout_s, 2.0)) as sock:
             req = {"type": f"{protocol_prefix}.shutdown", "v": 1, "id": "shutdown", "token": token}
             sock.sendall((json.dumps(req) + "\n").encode("utf-8"))
             # Best-effort read response with deadline
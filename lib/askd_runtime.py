@@ -1,23 +1,42 @@
 from __future__ import annotations
 
+import atexit
+import functools
 import os
+import queue
 import tempfile
+import threading
 import time
 from pathlib import Path
+from typing import IO, Callable, Optional
+
+from session_utils import safe_write_session
 
 
 def run_dir() -> Path:
-    override = (os.environ.get("CCB_RUN_DIR") or "").strip()
+    # Called for every log line/state lookup: read the env inputs, reuse the resolved Path.
+    nt_base = ""
+    if os.name == "nt":
+        nt_base = (os.environ.get("LOCALAPPDATA") or os.environ.get("APPDATA") or "").strip()
+    return _resolve_run_dir(
+        (os.environ.get("CCB_RUN_DIR") or "").strip(),
+        nt_base,
+        (os.environ.get("XDG_CACHE_HOME") or "").strip(),
+        os.environ.get("HOME") or os.environ.get("USERPROFILE") or "",
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _resolve_run_dir(override: str, nt_base: str, xdg_cache: str, _home: str) -> Path:
+    # `_home` only keys the cache: Path.home() below follows HOME/USERPROFILE.
     if override:
         return Path(override).expanduser()
 
     if os.name == "nt":
-        base = (os.environ.get("LOCALAPPDATA") or os.environ.get("APPDATA") or "").strip()
-        if base:
-            return Path(base) / "ccb"
+        if nt_base:
+            return Path(nt_base) / "ccb"
         return Path.home() / "AppData" / "Local" / "ccb"
 
-    xdg_cache = (os.environ.get("XDG_CACHE_HOME") or "").strip()
     if xdg_cache:
         return Path(xdg_cache) / "ccb"
     return Path.home() / ".cache" / "ccb"
@@ -47,7 +66,7 @@ def _env_int(name: str, default: int) -> int:
         return default
 
 
-def _maybe_shrink_log(path: Path) -> None:
+def _maybe_shrink_log(path: Path, before_replace: Optional[Callable[[], None]] = None) -> None:
     """
     Keep daemon logs from growing unbounded.
 
@@ -88,6 +107,8 @@ def _maybe_shrink_log(path: Path) -> None:
         try:
             with os.fdopen(fd, "wb") as out:
                 out.write(tail)
+            if before_replace is not None:
+                before_replace()
             os.replace(tmp_name, path)
         finally:
             try:
@@ -98,31 +119,182 @@ def _maybe_shrink_log(path: Path) -> None:
         return
 
 
-def write_log(path: Path, msg: str) -> None:
+def _prepare_log_file(path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Best-effort: keep daemon runtime dirs/logs private on multi-user systems.
     try:
-        _maybe_shrink_log(path)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        # Best-effort: keep daemon runtime dirs/logs private on multi-user systems.
-        try:
-            os.chmod(path.parent, 0o700)
-        except Exception:
-            pass
+        os.chmod(path.parent, 0o700)
+    except Exception:
+        pass
+
+    # Best-effort secure create: ensure logs are not world-readable if umask is permissive.
+    try:
+        if not path.exists():
+            fd = os.open(str(path), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+            os.close(fd)
+        os.chmod(path, 0o600)
+    except Exception:
+        pass
 
-        # Best-effort secure create: ensure logs are not world-readable if umask is permissive.
-        try:
-            if not path.exists():
-                fd = os.open(str(path), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
-                os.close(fd)
-            os.chmod(path, 0o600)
-        except Exception:
-            pass
 
+def write_log(path: Path, msg: str) -> None:
+    try:
+        _maybe_shrink_log(path)
+        _prepare_log_file(path)
         with path.open("a", encoding="utf-8") as handle:
             handle.write(msg.rstrip() + "\n")
     except Exception:
         pass
 
 
+class _BackgroundWriter(threading.Thread):
+    """
+    Perform daemon file writes from a single thread, off the request path.
+
+    - Log lines: one open append handle per log file; lines queued while a write is in
+      progress are batched into one write(). The handle is reopened when the file was
+      shrunk/replaced underneath it (st_nlink drops to 0).
+    - Session files: written atomically via safe_write_session; when several payloads for
+      the same file are pending, only the latest is written. Until then the queued content
+      is visible through pending_session(), so readers never see the older file.
+    """
+
+    _LOG = 0
+    _SESSION = 1
+    _FLUSH = 2
+
+    def __init__(self):
+        super().__init__(name="ccb-background-writer", daemon=True)
+        self._q: "queue.SimpleQueue[tuple[int, Optional[Path], object]]" = queue.SimpleQueue()
+        self._handles: dict[Path, IO[str]] = {}
+        self._pending_sessions: dict[Path, str] = {}
+        self._pending_lock = threading.Lock()
+
+    def submit_log(self, path: Path, msg: str) -> None:
+        self._q.put((self._LOG, path, msg.rstrip() + "\n"))
+
+    def submit_session(self, path: Path, content: str) -> None:
+        with self._pending_lock:
+            self._pending_sessions[path] = content
+        self._q.put((self._SESSION, path, content))
+
+    def pending_session(self, path: Path) -> Optional[str]:
+        with self._pending_lock:
+            return self._pending_sessions.get(path)
+
+    def flush(self, timeout: float = 2.0) -> bool:
+        done = threading.Event()
+        self._q.put((self._FLUSH, None, done))
+        return done.wait(timeout)
+
+    def run(self) -> None:
+        while True:
+            batch = [self._q.get()]
+            try:
+                while True:
+                    batch.append(self._q.get_nowait())
+            except queue.Empty:
+                pass
+            logs: dict[Path, list[str]] = {}
+            sessions: dict[Path, str] = {}
+            for kind, path, payload in batch:
+                if kind == self._FLUSH:
+                    self._write_pending(logs, sessions)
+                    logs, sessions = {}, {}
+                    payload.set()  # type: ignore[union-attr]
+                elif kind == self._SESSION:
+                    sessions[path] = str(payload)  # type: ignore[index]
+                else:
+                    logs.setdefault(path, []).append(str(payload))  # type: ignore[arg-type]
+            self._write_pending(logs, sessions)
+
+    def _write_pending(self, logs: dict[Path, list[str]], sessions: dict[Path, str]) -> None:
+        for path, content in sessions.items():
+            try:
+                safe_write_session(path, content)
+            except Exception:
+                pass
+            with self._pending_lock:
+                # A newer payload may have been queued meanwhile; that one stays pending.
+                if self._pending_sessions.get(path) is content:
+                    del self._pending_sessions[path]
+        for path, lines in logs.items():
+            try:
+                handle = self._open(path)
+                handle.write("".join(lines))
+                handle.flush()
+            except Exception:
+                self._close(path)
+
+    def _open(self, path: Path) -> IO[str]:
+        # Windows cannot replace a file we hold open, so drop the handle right before shrinking.
+        _maybe_shrink_log(path, before_replace=lambda: self._close(path))
+        handle = self._handles.get(path)
+        if handle is not None:
+            try:
+                if os.fstat(handle.fileno()).st_nlink > 0:
+                    return handle
+            except Exception:
+                pass
+            self._close(path)
+        _prepare_log_file(path)
+        handle = path.open("a", encoding="utf-8")
+        self._handles[path] = handle
+        return handle
+
+    def _close(self, path: Path) -> None:
+        handle = self._handles.pop(path, None)
+        if handle is not None:
+            try:
+                handle.close()
+            except Exception:
+                pass
+
+
+_WRITER: Optional[_BackgroundWriter] = None
+_WRITER_LOCK = threading.Lock()
+
+
+def _background_writer() -> _BackgroundWriter:
+    global _WRITER
+    writer = _WRITER
+    if writer is None:
+        with _WRITER_LOCK:
+            writer = _WRITER
+            if writer is None:
+                writer = _BackgroundWriter()
+                writer.start()
+                atexit.register(writer.flush)
+                _WRITER = writer
+    return writer
+
+
+def write_log_async(path: Path, msg: str) -> None:
+    """Queue a log line for the background writer (for hot daemon paths)."""
+    _background_writer().submit_log(path, msg)
+
+
+def write_session_async(path: Path, content: str) -> None:
+    """Queue an atomic session-file write for the background writer."""
+    _background_writer().submit_session(Path(path), content)
+
+
+def pending_session_write(path: Path) -> Optional[str]:
+    """Return content queued via write_session_async for path that is not on disk yet."""
+    writer = _WRITER
+    if writer is None:
+        return None
+    return writer.pending_session(Path(path))
+
+
+def flush_background_writes(timeout: float = 2.0) -> bool:
+    """Block until everything queued via write_log_async/write_session_async is on disk."""
+    writer = _WRITER
+    if writer is None:
+        return True
+    return writer.flush(timeout)
+
+
 def random_token() -> str:
     return os.urandom(16).hex()
 
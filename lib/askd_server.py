@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import json
 import os
+import select
+import socket
 import socketserver
 import sys
 import threading
@@ -12,16 +14,29 @@ from typing import Callable, Optional
 from askd_runtime import log_path, normalize_connect_host, run_dir, write_log
 from process_lock import ProviderLock
 from providers import ProviderDaemonSpec
-from session_utils import safe_write_session
 
 RequestHandler = Callable[[dict], dict]
 
+# Reused for every response; json.dumps(..., ensure_ascii=False) builds a new encoder per call.
+_RESPONSE_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
+# Upper bound for one request line; larger requests are rejected instead of buffered.
+_MAX_REQUEST_BYTES = 4 * 1024 * 1024
+
+# sockaddr_un.sun_path is 108 bytes on Linux and 104 on macOS/BSD.
+_UNIX_PATH_MAX = 104
+
 
 def _env_truthy(name: str) -> bool:
     raw = (os.environ.get(name) or "").strip().lower()
     return raw in {"1", "true", "yes", "on"}
 
 
+def _env_falsy(name: str) -> bool:
+    raw = (os.environ.get(name) or "").strip().lower()
+    return raw in {"0", "false", "no", "off"}
+
+
 def _env_parent_pid() -> Optional[int]:
     raw = (os.environ.get("CCB_PARENT_PID") or "").strip()
     if not raw:
@@ -56,6 +71,32 @@ def _is_pid_alive(pid: int) -> bool:
         return False
 
 
+def _wait_for_pid_exit(pid: int, poll_interval: float = 0.5) -> None:
+    """
+    Block until `pid` exits.
+
+    Linux: wait on a pidfd, which becomes readable when the process terminates, so the caller
+    sleeps in the kernel with no periodic wakeups. Elsewhere (or if pidfd is unavailable),
+    fall back to polling the pid.
+    """
+    pidfd_open = getattr(os, "pidfd_open", None)
+    if pidfd_open is not None:
+        try:
+            fd = pidfd_open(pid)
+        except ProcessLookupError:
+            return
+        except OSError:
+            fd = -1
+        if fd >= 0:
+            try:
+                select.select([fd], [], [])
+            finally:
+                os.close(fd)
+            return
+    while _is_pid_alive(pid):
+        time.sleep(poll_interval)
+
+
 class AskDaemonServer:
     def __init__(
         self,
@@ -96,20 +137,42 @@ class AskDaemonServer:
         response_type = f"{protocol_prefix}.response"
 
         class Handler(socketserver.StreamRequestHandler):
+            # Prompt-sized requests arrive in a few large recv()s instead of many 8 KiB ones.
+            rbufsize = 65536
+
+            @property
+            def _srv(self):
+                # The unix-socket listener shares the TCP server's state and lifecycle.
+                return getattr(self.server, "primary", self.server)
+
+            def setup(self) -> None:
+                super().setup()
+                # Multi-segment replies must not wait on Nagle + the client's delayed ACK.
+                # (Not disable_nagle_algorithm: this handler also serves the unix socket.)
+                if self.connection.family in (socket.AF_INET, socket.AF_INET6):
+                    try:
+                        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                    except OSError:
+                        pass
+
             def handle(self) -> None:
-                with self.server.activity_lock:
-                    self.server.active_requests += 1
-                    self.server.last_activity = time.time()
+                with self._srv.activity_lock:
+                    self._srv.active_requests += 1
+                self._srv.last_activity = time.monotonic()
+                self._srv.activity_event.set()
 
                 try:
-                    line = self.rfile.readline()
+                    line = self.rfile.readline(_MAX_REQUEST_BYTES)
                     if not line:
                         return
-                    msg = json.loads(line.decode("utf-8", errors="replace"))
+                    if len(line) >= _MAX_REQUEST_BYTES and not line.endswith(b"\n"):
+                        self._write({"type": response_type, "v": 1, "id": None, "exit_code": 1, "reply": "Request too large"})
+                        return
+                    msg = json.loads(line)
                 except Exception:
                     return
 
-                if msg.get("token") != self.server.token:
+                if msg.get("token") != self._srv.token:
                     self._write({"type": response_type, "v": 1, "id": msg.get("id"), "exit_code": 1, "reply": "Unauthorized"})
                     return
 
@@ -120,7 +183,7 @@ class AskDaemonServer:
 
                 if msg_type == f"{protocol_prefix}.shutdown":
                     self._write({"type": response_type, "v": 1, "id": msg.get("id"), "exit_code": 0, "reply": "OK"})
-                    threading.Thread(target=self.server.shutdown, daemon=True).start()
+                    threading.Thread(target=self._srv.shutdown, daemon=True).start()
                     return
 
                 if msg_type != f"{protocol_prefix}.request":
@@ -128,10 +191,10 @@ class AskDaemonServer:
                     return
 
                 try:
-                    resp = self.server.request_handler(msg)
+                    resp = self._srv.request_handler(msg)
                 except Exception as exc:
                     try:
-                        write_log(log_path(self.server.spec.log_file_name), f"[ERROR] request handler error: {exc}")
+                        write_log(log_path(self._srv.spec.log_file_name), f"[ERROR] request handler error: {exc}")
                     except Exception:
                         pass
                     self._write({"type": response_type, "v": 1, "id": msg.get("id"), "exit_code": 1, "reply": f"Internal error: {exc}"})
@@ -144,14 +207,9 @@ class AskDaemonServer:
 
             def _write(self, obj: dict) -> None:
                 try:
-                    data = (json.dumps(obj, ensure_ascii=False) + "\n").encode("utf-8")
-                    self.wfile.write(data)
-                    self.wfile.flush()
-                    try:
-                        with self.server.activity_lock:
-                            self.server.last_activity = time.time()
-                    except Exception:
-                        pass
+                    # One sendall per response; a plain attribute store needs no lock.
+                    self.request.sendall((_RESPONSE_ENCODER.encode(obj) + "\n").encode("utf-8"))
+                    self._srv.last_activity = time.monotonic()
                 except Exception:
                     pass
 
@@ -160,15 +218,19 @@ class AskDaemonServer:
                     super().finish()
                 finally:
                     try:
-                        with self.server.activity_lock:
-                            if self.server.active_requests > 0:
-                                self.server.active_requests -= 1
-                            self.server.last_activity = time.time()
+                        with self._srv.activity_lock:
+                            if self._srv.active_requests > 0:
+                                self._srv.active_requests -= 1
+                        self._srv.last_activity = time.monotonic()
+                        self._srv.activity_event.set()
                     except Exception:
                         pass
 
         class Server(socketserver.ThreadingTCPServer):
             allow_reuse_address = True
+            # Handler threads are fire-and-forget: don't track/join them per connection.
+            daemon_threads = True
+            block_on_close = False
 
         if self.request_queue_size is not None:
             try:
@@ -182,8 +244,9 @@ class AskDaemonServer:
                 httpd.token = self.token
                 httpd.request_handler = self.request_handler
                 httpd.active_requests = 0
-                httpd.last_activity = time.time()
+                httpd.last_activity = time.monotonic()
                 httpd.activity_lock = threading.Lock()
+                httpd.activity_event = threading.Event()
                 try:
                     httpd.idle_timeout_s = float(os.environ.get(self.spec.idle_timeout_env, "60") or "60")
                 except Exception:
@@ -194,46 +257,58 @@ class AskDaemonServer:
                     httpd.idle_timeout_s = 0.0
 
                 def _idle_monitor() -> None:
-                    timeout_s = float(getattr(httpd, "idle_timeout_s", 60.0) or 0.0)
+                    timeout_s = httpd.idle_timeout_s
                     if timeout_s <= 0:
                         return
+                    # Sleep until a request starts/finishes or the idle deadline passes; no periodic polling.
+                    wait_s = timeout_s
                     while True:
-                        time.sleep(0.5)
+                        if httpd.activity_event.wait(wait_s):
+                            httpd.activity_event.clear()
                         try:
                             with httpd.activity_lock:
                                 active = int(httpd.active_requests or 0)
-                                last = float(httpd.last_activity or time.time())
+                            last = float(httpd.last_activity or time.monotonic())
                         except Exception:
                             active = 0
-                            last = time.time()
-                        if active == 0 and (time.time() - last) >= timeout_s:
-                            write_log(
-                                log_path(self.spec.log_file_name),
-                                f"[INFO] {self.spec.daemon_key} idle timeout ({int(timeout_s)}s) reached; shutting down",
-                            )
-                            threading.Thread(target=httpd.shutdown, daemon=True).start()
-                            return
+                            last = time.monotonic()
+                        if active > 0:
+                            # finish() sets the event again when the request completes.
+                            wait_s = timeout_s
+                            continue
+                        idle_s = time.monotonic() - last
+                        if idle_s < timeout_s:
+                            wait_s = timeout_s - idle_s
+                            continue
+                        write_log(
+                            log_path(self.spec.log_file_name),
+                            f"[INFO] {self.spec.daemon_key} idle timeout ({int(timeout_s)}s) reached; shutting down",
+                        )
+                        threading.Thread(target=httpd.shutdown, daemon=True).start()
+                        return
 
                 threading.Thread(target=_idle_monitor, daemon=True).start()
 
-                if getattr(httpd, "parent_pid", 0):
-                    parent_pid = int(httpd.parent_pid or 0)
+                if httpd.parent_pid:
+                    parent_pid = httpd.parent_pid
 
                     def _parent_monitor() -> None:
-                        while True:
-                            time.sleep(0.5)
-                            if not _is_pid_alive(parent_pid):
-                                write_log(
-                                    log_path(self.spec.log_file_name),
-                                    f"[INFO] {self.spec.daemon_key} parent pid {parent_pid} exited; shutting down",
-                                )
-                                threading.Thread(target=httpd.shutdown, daemon=True).start()
-                                return
+                        _wait_for_pid_exit(parent_pid)
+                        write_log(
+                            log_path(self.spec.log_file_name),
+                            f"[INFO] {self.spec.daemon_key} parent pid {parent_pid} exited; shutting down",
+                        )
+                        threading.Thread(target=httpd.shutdown, daemon=True).start()
 
                     threading.Thread(target=_parent_monitor, daemon=True).start()
 
+                unix_srv = self._start_unix_listener(Handler, httpd)
                 actual_host, actual_port = httpd.server_address
-                self._write_state(str(actual_host), int(actual_port))
+                self._write_state(
+                    str(actual_host),
+                    int(actual_port),
+                    unix_socket=str(unix_srv.server_address) if unix_srv else None,
+                )
                 write_log(
                     log_path(self.spec.log_file_name),
                     f"[INFO] {self.spec.daemon_key} started pid={os.getpid()} addr={actual_host}:{actual_port}",
@@ -241,6 +316,8 @@ class AskDaemonServer:
                 try:
                     httpd.serve_forever(poll_interval=0.2)
                 finally:
+                    if unix_srv:
+                        self._stop_unix_listener(unix_srv)
                     write_log(log_path(self.spec.log_file_name), f"[INFO] {self.spec.daemon_key} stopped")
                     if self.on_stop:
                         try:
@@ -254,9 +331,68 @@ class AskDaemonServer:
                 pass
         return 0
 
-    def _write_state(self, host: str, port: int) -> None:
+    def _start_unix_listener(self, handler: type, primary: socketserver.BaseServer):
+        """
+        Also accept local clients on a unix socket next to the state file (POSIX only).
+
+        Local connects then skip the TCP stack; TCP stays available for everything else.
+        The token is still required; the 0600 socket mode is an extra guard.
+        """
+        server_cls = getattr(socketserver, "ThreadingUnixStreamServer", None)
+        if server_cls is None or _env_falsy("CCB_ASKD_UNIX_SOCKET"):
+            return None
+        sock_path = self.state_file.with_suffix(".sock")
+        if len(os.fsencode(str(sock_path))) >= _UNIX_PATH_MAX:
+            return None
+
+        class UnixServer(server_cls):
+            daemon_threads = True
+            block_on_close = False
+
+        try:
+            # We hold the provider lock, so any existing socket file is stale.
+            sock_path.unlink()
+        except FileNotFoundError:
+            pass
+        except Exception:
+            return None
+        try:
+            srv = UnixServer(str(sock_path), handler)
+        except Exception as exc:
+            write_log(log_path(self.spec.log_file_name), f"[WARN] unix socket disabled: {exc}")
+            return None
+        # chmod after bind rather than swapping the process-wide umask, which would
+        # also apply to files other threads create meanwhile.
+        try:
+            os.chmod(sock_path, 0o600)
+        except Exception as exc:
+            write_log(log_path(self.spec.log_file_name), f"[WARN] unix socket disabled: {exc}")
+            srv.server_close()
+            try:
+                sock_path.unlink()
+            except Exception:
+                pass
+            return None
+        srv.primary = primary
+        threading.Thread(target=srv.serve_forever, kwargs={"poll_interval": 0.2}, daemon=True).start()
+        return srv
+
+    @staticmethod
+    def _stop_unix_listener(srv) -> None:
+        try:
+            srv.shutdown()
+            srv.server_close()
+        except Exception:
+            pass
+        try:
+            os.unlink(srv.server_address)
+        except Exception:
+            pass
+
+    def _write_state(self, host: str, port: int, unix_socket: Optional[str] = None) -> None:
+        pid = os.getpid()
         payload = {
-            "pid": os.getpid(),
+            "pid": pid,
             "host": host,
             "connect_host": normalize_connect_host(host),
             "port": port,
@@ -266,11 +402,25 @@ class AskDaemonServer:
             "parent_pid": int(self.parent_pid or 0) or None,
             "managed": bool(self.managed),
         }
+        if unix_socket:
+            payload["unix_socket"] = unix_socket
         self.state_file.parent.mkdir(parents=True, exist_ok=True)
-        ok, _err = safe_write_session(self.state_file, json.dumps(payload, ensure_ascii=False, indent=2) + "\n")
-        if ok:
-            if os.name != "nt":
-                try:
-                    os.chmod(self.state_file, 0o600)
-                except Exception:
-                    pass
+        data = (json.dumps(payload, ensure_ascii=False, indent=2) + "\n").encode("utf-8")
+        # The state file carries the auth token: create the temp file 0600 up front (no window
+        # where it is umask-readable), write it in one call, fsync it so a crash cannot leave an
+        # empty file behind the rename, and swap it in atomically.
+        tmp = self.state_file.with_name(f".{self.state_file.name}.{pid}.tmp")
+        try:
+            tmp.unlink(missing_ok=True)
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(data)
+                handle.flush()
+                os.fsync(handle.fileno())
+            os.replace(tmp, self.state_file)
+        except OSError as exc:
+            write_log(log_path(self.spec.log_file_name), f"[WARN] failed to write state file: {exc}")
+            try:
+                tmp.unlink(missing_ok=True)
+            except OSError:
+                pass
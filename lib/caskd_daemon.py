@@ -845,13 +845,7 @@ class CaskdServer:
             st = None
         try:
             if isinstance(st, dict) and int(st.get("pid") or 0) == os.getpid():
-                self.state_file.unlink(missing_ok=True)  # py3.8+: missing_ok
-        except TypeError:
-            try:
-                if isinstance(st, dict) and int(st.get("pid") or 0) == os.getpid() and self.state_file.exists():
-                    self.state_file.unlink()
-            except Exception:
-                pass
+                self.state_file.unlink(missing_ok=True)
         except Exception:
             pass
 
@@ -3,6 +3,7 @@ from __future__ import annotations
 import re
 import secrets
 from dataclasses import dataclass
+from functools import lru_cache
 
 
 REQ_ID_PREFIX = "CCB_REQ_ID:"
@@ -58,16 +59,18 @@ def wrap_codex_prompt(message: str, req_id: str) -> str:
     )
 
 
+@lru_cache(maxsize=256)
 def done_line_re(req_id: str) -> re.Pattern[str]:
     return re.compile(DONE_LINE_RE_TEMPLATE.format(req_id=re.escape(req_id)))
 
 
 def is_done_text(text: str, req_id: str) -> bool:
-    lines = [ln.rstrip() for ln in (text or "").splitlines()]
-    for i in range(len(lines) - 1, -1, -1):
-        if _is_trailing_noise_line(lines[i]):
+    # Polled on every reply update: walk lines from the end and stop at the first non-noise line.
+    for line in reversed((text or "").splitlines()):
+        line = line.rstrip()
+        if _is_trailing_noise_line(line):
             continue
-        return bool(done_line_re(req_id).match(lines[i]))
+        return bool(done_line_re(req_id).match(line))
     return False
 
 
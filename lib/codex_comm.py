@@ -1079,12 +1079,10 @@ class CodexCommunicator:
             except PermissionError as e:
                 print(f"⚠️  Cannot update {project_file.name}: {e}", file=sys.stderr)
                 print(f"💡 Try: sudo chown $USER:$USER {project_file}", file=sys.stderr)
-                if tmp_file.exists():
-                    tmp_file.unlink(missing_ok=True)
+                tmp_file.unlink(missing_ok=True)
             except Exception as e:
                 print(f"⚠️  Failed to update {project_file.name}: {e}", file=sys.stderr)
-                if tmp_file.exists():
-                    tmp_file.unlink(missing_ok=True)
+                tmp_file.unlink(missing_ok=True)
 
         registry_path = registry_path_for_session(self.session_id)
         if registry_path.exists():
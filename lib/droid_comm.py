@@ -11,6 +11,7 @@ import heapq
 import json
 import os
 import time
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -34,6 +35,9 @@ def _default_sessions_root() -> Path:
 
 DROID_SESSIONS_ROOT = _default_sessions_root()
 
+# Parsed .droid-session payloads keyed by path, invalidated by (mtime, size).
+_SESSION_INFO_CACHE: Dict[str, Tuple[float, int, dict]] = {}
+
 
 def _normalize_path_for_match(value: str) -> str:
     s = (value or "").strip()
@@ -67,10 +71,50 @@ def _path_is_same_or_parent(parent: str, child: str) -> bool:
     return child_norm == parent_norm or child_norm[len(parent_norm) :].startswith("/")
 
 
+def _safe_mtime(path: Path) -> Optional[float]:
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return None
+
+
+_SESSION_START_PROBE_BYTES = 4096
+
+
+def _session_start_fields(entry: Any) -> Optional[Tuple[Optional[str], Optional[str]]]:
+    if not isinstance(entry, dict) or entry.get("type") != "session_start":
+        return None
+    cwd = entry.get("cwd")
+    sid = entry.get("id")
+    cwd_str = str(cwd).strip() if isinstance(cwd, str) else None
+    sid_str = str(sid).strip() if isinstance(sid, str) else None
+    return cwd_str or None, sid_str or None
+
+
 def read_droid_session_start(session_path: Path, *, max_lines: int = 30) -> Tuple[Optional[str], Optional[str]]:
     """
     Best-effort read of the session_start line for (cwd, session_id).
+
+    session_start is almost always the first line, so try a single small read
+    first and only fall back to scanning up to max_lines lines.
     """
+    try:
+        fd = os.open(str(session_path), os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        try:
+            chunk = os.read(fd, _SESSION_START_PROBE_BYTES)
+        finally:
+            os.close(fd)
+    except OSError:
+        return None, None
+    nl = chunk.find(b"\n")
+    if nl >= 0:
+        try:
+            fields = _session_start_fields(json.loads(chunk[:nl].decode("utf-8", errors="replace")))
+        except Exception:
+            fields = None
+        if fields is not None:
+            return fields
+
     try:
         with session_path.open("r", encoding="utf-8", errors="replace") as handle:
             for _ in range(max_lines):
@@ -84,13 +128,9 @@ def read_droid_session_start(session_path: Path, *, max_lines: int = 30) -> Tupl
                     entry = json.loads(line)
                 except Exception:
                     continue
-                if not isinstance(entry, dict) or entry.get("type") != "session_start":
-                    continue
-                cwd = entry.get("cwd")
-                sid = entry.get("id")
-                cwd_str = str(cwd).strip() if isinstance(cwd, str) else None
-                sid_str = str(sid).strip() if isinstance(sid, str) else None
-                return cwd_str or None, sid_str or None
+                fields = _session_start_fields(entry)
+                if fields is not None:
+                    return fields
     except OSError:
         return None, None
     return None, None
@@ -136,6 +176,42 @@ def _extract_message(entry: dict, role: str) -> Optional[str]:
     return None
 
 
+_EVENT_ROLES = ("user", "assistant")
+
+# Cheap substring checks that let the tail readers skip json.loads on lines
+# (tool output, thinking deltas, ...) that cannot carry a user/assistant message.
+# Matched against the lowercased line: the extractors accept roles in any case.
+_ASSISTANT_TAG = b"assistant"
+_USER_TAG = b"user"
+
+
+def _extract_role_and_text(entry: dict) -> Optional[Tuple[str, str]]:
+    """
+    Single-pass equivalent of trying _extract_message for "user" then "assistant".
+    """
+    if not isinstance(entry, dict):
+        return None
+    entry_type = str(entry.get("type") or "").strip().lower()
+    message = entry.get("message")
+    inner_role = ""
+    if entry_type == "message" and isinstance(message, dict):
+        inner_role = str(message.get("role") or "").strip().lower()
+    outer_role = str(entry.get("role") or entry_type).strip().lower()
+    if inner_role not in _EVENT_ROLES and outer_role not in _EVENT_ROLES:
+        return None
+    for role in _EVENT_ROLES:
+        if inner_role == role:
+            # Like _extract_message, a matching inner role is decisive even when empty.
+            text = _extract_content_text(message.get("content"))
+            if text:
+                return role, text
+        elif outer_role == role:
+            text = _extract_content_text(entry.get("content") or message)
+            if text:
+                return role, text
+    return None
+
+
 class DroidLogReader:
     """Reads Droid session logs from ~/.factory/sessions"""
 
@@ -154,6 +230,13 @@ class DroidLogReader:
         except Exception:
             limit = 200
         self._scan_limit = max(1, limit)
+        try:
+            rescan = float(os.environ.get("DROID_SESSION_RESCAN_INTERVAL", "5.0"))
+        except Exception:
+            rescan = 5.0
+        self._rescan_interval = max(0.0, rescan)
+        # time.monotonic() of the last full scan; -inf forces the first one.
+        self._last_full_scan = float("-inf")
 
     def set_preferred_session(self, session_path: Optional[Path]) -> None:
         if not session_path:
@@ -197,25 +280,18 @@ class DroidLogReader:
     def _scan_latest_session(self) -> Optional[Path]:
         if not self.root.exists():
             return None
-        heap: List[Tuple[float, str]] = []
+        entries = (
+            (mtime, str(path))
+            for path in self.root.glob("**/*.jsonl")
+            if not path.name.startswith(".") and path.is_file()
+            for mtime in (_safe_mtime(path),)
+            if mtime is not None
+        )
         try:
-            for path in self.root.glob("**/*.jsonl"):
-                if not path.is_file() or path.name.startswith("."):
-                    continue
-                try:
-                    mtime = path.stat().st_mtime
-                except OSError:
-                    continue
-                item = (mtime, str(path))
-                if len(heap) < self._scan_limit:
-                    heapq.heappush(heap, item)
-                else:
-                    if item[0] > heap[0][0]:
-                        heapq.heapreplace(heap, item)
+            candidates = heapq.nlargest(self._scan_limit, entries, key=itemgetter(0))
         except Exception:
             return None
 
-        candidates = sorted(heap, key=lambda x: x[0], reverse=True)
         work_dir_str = str(self.work_dir)
         for _, path_str in candidates:
             path = Path(path_str)
@@ -248,9 +324,24 @@ class DroidLogReader:
 
     def _latest_session(self) -> Optional[Path]:
         preferred = self._preferred_session
+        preferred_alive = False
+        if preferred:
+            try:
+                os.stat(preferred)
+                preferred_alive = True
+            except OSError:
+                preferred_alive = False
+
+        # While the preferred session is still on disk, the recursive glob only
+        # needs to run once per rescan interval to notice a newer session.
+        now = time.monotonic()
+        if preferred_alive and now - self._last_full_scan < self._rescan_interval:
+            return preferred
+
         scanned = self._scan_latest_session()
+        self._last_full_scan = now
 
-        if preferred and preferred.exists():
+        if preferred and preferred_alive:
             if scanned and scanned.exists():
                 try:
                     pref_mtime = preferred.stat().st_mtime
@@ -286,7 +377,7 @@ class DroidLogReader:
                 offset = session.stat().st_size
             except OSError:
                 offset = 0
-        return {"session_path": session, "offset": offset, "carry": b""}
+        return {"session_path": session, "offset": offset, "carry": bytearray()}
 
     def wait_for_message(self, state: Dict[str, Any], timeout: float) -> Tuple[Optional[str], Dict[str, Any]]:
         return self._read_since(state, timeout=timeout, block=True)
@@ -308,9 +399,9 @@ class DroidLogReader:
         try:
             with session.open("r", encoding="utf-8", errors="replace") as handle:
                 for line in handle:
-                    line = line.strip()
-                    if not line:
+                    if "assistant" not in line.lower():
                         continue
+                    line = line.strip()
                     try:
                         entry = json.loads(line)
                     except Exception:
@@ -338,13 +429,14 @@ class DroidLogReader:
                         entry = json.loads(line)
                     except Exception:
                         continue
-                    user_msg = _extract_message(entry, "user")
-                    if user_msg:
-                        last_user = user_msg
+                    event = _extract_role_and_text(entry)
+                    if not event:
                         continue
-                    assistant_msg = _extract_message(entry, "assistant")
-                    if assistant_msg:
-                        pairs.append((last_user or "", assistant_msg))
+                    role, text = event
+                    if role == "user":
+                        last_user = text
+                    else:
+                        pairs.append((last_user or "", text))
                         last_user = None
         except OSError:
             return []
@@ -365,7 +457,7 @@ class DroidLogReader:
             if current_state.get("session_path") != session:
                 current_state["session_path"] = session
                 current_state["offset"] = 0
-                current_state["carry"] = b""
+                current_state["carry"] = bytearray()
 
             message, current_state = self._read_new_messages(session, current_state)
             if message:
@@ -375,35 +467,53 @@ class DroidLogReader:
                 return None, current_state
             time.sleep(self._poll_interval)
 
-    def _read_new_messages(self, session: Path, state: Dict[str, Any]) -> Tuple[Optional[str], Dict[str, Any]]:
-        offset = int(state.get("offset") or 0)
-        carry = state.get("carry") or b""
-        try:
-            size = session.stat().st_size
-        except OSError:
-            return None, state
-
-        if size < offset:
-            offset = 0
-            carry = b""
+    def _read_new_lines(self, session: Path, state: Dict[str, Any]) -> Optional[Tuple[List[bytearray], Dict[str, Any]]]:
+        """
+        Read bytes appended since state["offset"] and split off complete lines.
 
+        The partial trailing line stays in state["carry"], a bytearray that is
+        extended in place rather than re-concatenated on every poll.
+        """
+        offset = int(state.get("offset") or 0)
+        carry = state.get("carry")
+        if not isinstance(carry, bytearray):
+            carry = bytearray(carry or b"")
         try:
             with session.open("rb") as handle:
+                size = os.fstat(handle.fileno()).st_size
+                if size < offset:
+                    offset = 0
+                    carry = bytearray()
+                if size == offset:
+                    return [], {"session_path": session, "offset": offset, "carry": carry}
                 handle.seek(offset)
                 data = handle.read()
         except OSError:
-            return None, state
+            return None
 
-        new_offset = offset + len(data)
-        buf = carry + data
-        lines = buf.split(b"\n")
-        if buf and not buf.endswith(b"\n"):
-            carry = lines.pop()
-        else:
-            carry = b""
+        carry.extend(data)
+        lines: List[bytearray] = []
+        start = 0
+        while True:
+            nl = carry.find(b"\n", start)
+            if nl < 0:
+                break
+            lines.append(carry[start:nl])
+            start = nl + 1
+        if start:
+            del carry[:start]
+        return lines, {"session_path": session, "offset": offset + len(data), "carry": carry}
+
+    def _read_new_messages(self, session: Path, state: Dict[str, Any]) -> Tuple[Optional[str], Dict[str, Any]]:
+        read = self._read_new_lines(session, state)
+        if read is None:
+            return None, state
+        lines, new_state = read
 
         latest: Optional[str] = None
         for raw in lines:
+            if _ASSISTANT_TAG not in raw.lower():
+                continue
             line = raw.strip()
             if not line:
                 continue
@@ -415,7 +525,6 @@ class DroidLogReader:
             if msg:
                 latest = msg
 
-        new_state = {"session_path": session, "offset": new_offset, "carry": carry}
         return latest, new_state
 
     def _read_since_events(self, state: Dict[str, Any], timeout: float, block: bool) -> Tuple[List[Tuple[str, str]], Dict[str, Any]]:
@@ -433,7 +542,7 @@ class DroidLogReader:
             if current_state.get("session_path") != session:
                 current_state["session_path"] = session
                 current_state["offset"] = 0
-                current_state["carry"] = b""
+                current_state["carry"] = bytearray()
 
             events, current_state = self._read_new_events(session, current_state)
             if events:
@@ -444,50 +553,30 @@ class DroidLogReader:
             time.sleep(self._poll_interval)
 
     def _read_new_events(self, session: Path, state: Dict[str, Any]) -> Tuple[List[Tuple[str, str]], Dict[str, Any]]:
-        offset = int(state.get("offset") or 0)
-        carry = state.get("carry") or b""
-        try:
-            size = session.stat().st_size
-        except OSError:
+        read = self._read_new_lines(session, state)
+        if read is None:
             return [], state
-
-        if size < offset:
-            offset = 0
-            carry = b""
-
-        try:
-            with session.open("rb") as handle:
-                handle.seek(offset)
-                data = handle.read()
-        except OSError:
-            return [], state
-
-        new_offset = offset + len(data)
-        buf = carry + data
-        lines = buf.split(b"\n")
-        if buf and not buf.endswith(b"\n"):
-            carry = lines.pop()
-        else:
-            carry = b""
+        lines, new_state = read
 
         events: List[Tuple[str, str]] = []
+        append = events.append
+        loads = json.loads
+        extract = _extract_role_and_text
         for raw in lines:
+            lowered = raw.lower()
+            if _ASSISTANT_TAG not in lowered and _USER_TAG not in lowered:
+                continue
             line = raw.strip()
             if not line:
                 continue
             try:
-                entry = json.loads(line.decode("utf-8", errors="replace"))
+                entry = loads(line.decode("utf-8", errors="replace"))
             except Exception:
                 continue
-            user_msg = _extract_message(entry, "user")
-            if user_msg:
-                events.append(("user", user_msg))
-                continue
-            assistant_msg = _extract_message(entry, "assistant")
-            if assistant_msg:
-                events.append(("assistant", assistant_msg))
+            event = extract(entry)
+            if event:
+                append(event)
 
-        new_state = {"session_path": session, "offset": new_offset, "carry": carry}
         return events, new_state
 
 
@@ -563,12 +652,21 @@ class DroidCommunicator:
         project_session = self._find_session_file()
         if not project_session:
             return None
+        key = str(project_session)
         try:
-            with project_session.open("r", encoding="utf-8") as f:
-                data = json.load(f)
-            if not isinstance(data, dict) or data.get("active", False) is False:
+            st = os.stat(key)
+            cached = _SESSION_INFO_CACHE.get(key)
+            if cached and cached[0] == st.st_mtime and cached[1] == st.st_size:
+                data = dict(cached[2])
+            else:
+                with project_session.open("r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if not isinstance(data, dict):
+                    return None
+                _SESSION_INFO_CACHE[key] = (st.st_mtime, st.st_size, dict(data))
+            if data.get("active", False) is False:
                 return None
-            data["_session_file"] = str(project_session)
+            data["_session_file"] = key
             return data
         except Exception:
             return None
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import os
+import re
 import threading
 import time
 from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
 from typing import Optional
 
@@ -18,12 +21,12 @@ from gaskd_protocol import (
     make_req_id,
     wrap_gemini_prompt,
 )
-from gaskd_session import compute_session_key, load_project_session
-from gemini_comm import GeminiLogReader
+from gaskd_session import compute_session_key, find_project_session_file, load_project_session
+from gemini_comm import GeminiLogReader, load_json_file
 from pane_registry import upsert_registry
 from project_id import compute_ccb_project_id
 from terminal import get_backend_for_session
-from askd_runtime import state_file_path, log_path, write_log, random_token
+from askd_runtime import flush_background_writes, state_file_path, log_path, write_log_async, random_token
 import askd_rpc
 from askd_server import AskDaemonServer
 from providers import GASKD_SPEC
@@ -35,97 +38,172 @@ def _now_ms() -> int:
 
 
 def _write_log(line: str) -> None:
-    write_log(log_path(GASKD_SPEC.log_file_name), line)
+    write_log_async(log_path(GASKD_SPEC.log_file_name), line)
+
+
+# Observed in Gemini session JSON: {"type":"info","content":"Request cancelled."}
+_CANCEL_TEXT_RE = re.compile(r"request cancel{1,2}ed", re.IGNORECASE)
 
 
 def _is_cancel_text(text: str) -> bool:
-    s = (text or "").strip().lower()
-    if not s:
+    if not text:
         return False
-    # Observed in Gemini session JSON: {"type":"info","content":"Request cancelled."}
-    if "request cancelled" in s or "request canceled" in s:
+    return _CANCEL_TEXT_RE.search(text) is not None
+
+
+# ccb_session_id -> (time.monotonic(), serialized record) of the last registry upsert.
+# Back-to-back requests re-derive the same binding; identical records inside the window
+# are not rewritten (the registry's updated_at is then at most the window behind).
+_REGISTRY_UPSERTS: dict[str, tuple[float, str]] = {}
+_REGISTRY_UPSERT_WINDOW_S = 5.0
+
+
+def _upsert_registry_coalesced(record: dict) -> bool:
+    key = str(record.get("ccb_session_id") or "")
+    blob = json.dumps(record, sort_keys=True, ensure_ascii=False)
+    now = time.monotonic()
+    last = _REGISTRY_UPSERTS.get(key)
+    if last is not None and last[1] == blob and now - last[0] < _REGISTRY_UPSERT_WINDOW_S:
         return True
-    return False
+    ok = upsert_registry(record)
+    if ok:
+        _REGISTRY_UPSERTS[key] = (now, blob)
+    else:
+        _REGISTRY_UPSERTS.pop(key, None)
+    return ok
 
 
-def _read_session_messages(session_path: Path) -> Optional[list[dict]]:
-    # Gemini session JSON may be written in-place; retry briefly on JSONDecodeError.
-    for attempt in range(10):
-        try:
-            with session_path.open("r", encoding="utf-8") as handle:
-                data = json.load(handle)
-            messages = data.get("messages", []) if isinstance(data, dict) else []
-            return messages if isinstance(messages, list) else []
-        except json.JSONDecodeError:
-            if attempt < 9:
-                time.sleep(0.05)
-                continue
-            return None
-        except OSError:
-            return None
-        except Exception:
-            return None
+# Parsed Gemini session messages keyed by path, invalidated by (mtime_ns, size).
+# Callers treat the cached list as read-only.
+_SESSION_CACHE: dict[str, tuple[int, int, list[dict]]] = {}
+_SESSION_CACHE_MAX = 32
+# Submits arrive on several handler threads; iterating the dict to evict must not race inserts.
+_SESSION_CACHE_LOCK = threading.Lock()
 
 
-def _cancel_applies_to_req(messages: list[dict], cancel_index: int, req_id: str) -> bool:
-    # The info message itself doesn't include req_id; match it to the nearest preceding user prompt.
-    needle = f"CCB_REQ_ID: {req_id}"
-    for j in range(cancel_index - 1, -1, -1):
+def _read_session_messages(session_path: Path) -> Optional[list[dict]]:
+    key = str(session_path)
+    try:
+        st = os.stat(key)
+    except OSError:
+        _SESSION_CACHE.pop(key, None)
+        return None
+    cached = _SESSION_CACHE.get(key)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+
+    data = load_json_file(session_path, st)
+    if data is None:
+        return None
+    messages = data.get("messages", []) if isinstance(data, dict) else []
+    messages = messages if isinstance(messages, list) else []
+    # Keyed by the stat taken before reading: a concurrent rewrite only causes a re-parse.
+    with _SESSION_CACHE_LOCK:
+        _SESSION_CACHE.pop(key, None)
+        while len(_SESSION_CACHE) >= _SESSION_CACHE_MAX:
+            _SESSION_CACHE.pop(next(iter(_SESSION_CACHE)), None)
+        _SESSION_CACHE[key] = (st.st_mtime_ns, st.st_size, messages)
+    return messages
+
+
+def _message_text(msg: dict) -> str:
+    content = msg.get("content")
+    return content if isinstance(content, str) else str(content or "")
+
+
+def _preceding_user_text(messages: list[dict], index: int) -> Optional[str]:
+    for j in range(min(index, len(messages)) - 1, -1, -1):
         msg = messages[j]
-        if not isinstance(msg, dict):
-            continue
-        if msg.get("type") != "user":
-            continue
-        content = msg.get("content")
-        if not isinstance(content, str):
-            content = str(content or "")
-        return needle in content
-    return False
+        if isinstance(msg, dict) and msg.get("type") == "user":
+            return _message_text(msg)
+    return None
 
 
 def _detect_request_cancelled(session_path: Path, *, from_index: int, req_id: str) -> bool:
+    """Scan messages[from_index:] for a cancel notice that belongs to req_id."""
     if from_index < 0:
         from_index = 0
     messages = _read_session_messages(session_path)
     if messages is None:
         return False
-    for i in range(min(from_index, len(messages)), len(messages)):
-        msg = messages[i]
+    # The info message itself doesn't include req_id; it belongs to the nearest preceding user prompt.
+    # Track that prompt while walking forward instead of back-scanning for every cancel notice.
+    needle = f"CCB_REQ_ID: {req_id}"
+    owner: Optional[str] = None
+    owner_resolved = False
+    for msg in islice(messages, from_index, None):
         if not isinstance(msg, dict):
             continue
-        if msg.get("type") != "info":
+        msg_type = msg.get("type")
+        if msg_type == "user":
+            owner = _message_text(msg)
+            owner_resolved = True
+            continue
+        if msg_type != "info":
             continue
-        content = msg.get("content")
-        if not isinstance(content, str):
-            content = str(content or "")
-        if not _is_cancel_text(content):
+        if not _is_cancel_text(_message_text(msg)):
             continue
-        if _cancel_applies_to_req(messages, i, req_id):
+        if not owner_resolved:
+            owner = _preceding_user_text(messages, from_index)
+            owner_resolved = True
+        if owner is not None and needle in owner:
             return True
     return False
 
 
 def _read_gemini_session_id(session_path: Path) -> str:
-    if not session_path or not session_path.exists():
+    if not session_path:
         return ""
-    # Gemini CLI may write in-place; retry briefly on JSONDecodeError.
-    for attempt in range(10):
-        try:
-            with session_path.open("r", encoding="utf-8") as handle:
-                payload = json.load(handle)
-            if isinstance(payload, dict) and isinstance(payload.get("sessionId"), str):
-                return payload["sessionId"]
-            return ""
-        except json.JSONDecodeError:
-            if attempt < 9:
-                time.sleep(0.05)
-                continue
-            return ""
-        except Exception:
-            return ""
-
-
-@dataclass
+    payload = load_json_file(session_path)
+    if isinstance(payload, dict) and isinstance(payload.get("sessionId"), str):
+        return payload["sessionId"]
+    return ""
+
+
+def _pane_check_interval() -> float:
+    return float(os.environ.get("CCB_GASKD_PANE_CHECK_INTERVAL", "2.0") or "2.0")
+
+
+class _PaneLivenessCache:
+    """
+    Share one pane-liveness snapshot across all in-flight requests.
+
+    For tmux, a single `list-panes -a` call answers every worker's check within max_age_s,
+    instead of each request forking tmux on its own cadence. Snapshots are keyed by tmux
+    server (backend class + socket name), not backend instance: get_backend_for_session()
+    hands every request a fresh TmuxBackend. Other backends fall through to
+    backend.is_alive().
+    """
+
+    def __init__(self, max_age_s: Optional[float] = None):
+        # Default to the pane check interval so concurrent requests share one snapshot per interval.
+        self._max_age_s = _pane_check_interval() if max_age_s is None else max_age_s
+        self._lock = threading.Lock()
+        # (backend class, tmux socket name) -> (time.monotonic() when taken, {pane_id: alive})
+        self._snapshots: dict[tuple[type, Optional[str]], tuple[float, dict[str, bool]]] = {}
+
+    def is_alive(self, backend, pane_id: str) -> bool:
+        lister = getattr(backend, "list_pane_liveness", None)
+        if not callable(lister) or not str(pane_id or "").startswith("%"):
+            return bool(backend.is_alive(pane_id))
+        key = (type(backend), getattr(backend, "socket_name", None))
+        with self._lock:
+            now = time.monotonic()
+            cached = self._snapshots.get(key)
+            if cached is None or now - cached[0] >= self._max_age_s:
+                snapshot = lister()
+                if snapshot is None:
+                    self._snapshots.pop(key, None)
+                    return bool(backend.is_alive(pane_id))
+                cached = (now, snapshot)
+                self._snapshots[key] = cached
+        return cached[1].get(pane_id, False)
+
+
+_PANE_LIVENESS = _PaneLivenessCache()
+
+
+@dataclass(slots=True)
 class _QueuedTask:
     request: GaskdRequest
     created_ms: int
@@ -162,6 +240,7 @@ class _SessionWorker(BaseSessionWorker[_QueuedTask, GaskdResult]):
                 done_seen=False,
                 done_ms=None,
             )
+        session.defer_writes = True
 
         ok, pane_or_err = session.ensure_pane()
         if not ok:
@@ -205,7 +284,7 @@ class _SessionWorker(BaseSessionWorker[_QueuedTask, GaskdResult]):
                 ccb_pid = compute_ccb_project_id(Path(session.work_dir))
             ccb_session_id = str(session.data.get("ccb_session_id") or session.data.get("session_id") or "").strip()
             if ccb_session_id:
-                upsert_registry(
+                _upsert_registry_coalesced(
                     {
                         "ccb_session_id": ccb_session_id,
                         "ccb_project_id": ccb_pid or None,
@@ -228,29 +307,27 @@ class _SessionWorker(BaseSessionWorker[_QueuedTask, GaskdResult]):
         prompt = wrap_gemini_prompt(req.message, task.req_id)
         backend.send_text(pane_id, prompt)
 
-        deadline = None if float(req.timeout_s) < 0.0 else (time.time() + float(req.timeout_s))
+        # Monotonic clock: timeouts are immune to wall-clock steps, and one read per iteration suffices.
+        deadline = None if float(req.timeout_s) < 0.0 else (time.monotonic() + float(req.timeout_s))
         done_seen = False
         done_ms: int | None = None
         latest_reply = ""
 
-        pane_check_interval = float(os.environ.get("CCB_GASKD_PANE_CHECK_INTERVAL", "2.0") or "2.0")
-        last_pane_check = time.time()
+        pane_check_interval = _pane_check_interval()
+        last_pane_check = time.monotonic()
 
         while True:
-            if deadline is not None:
-                remaining = deadline - time.time()
-                if remaining <= 0:
-                    break
-                wait_step = min(remaining, 1.0)
-            else:
-                wait_step = 1.0
+            now = time.monotonic()
+            if deadline is not None and now >= deadline:
+                break
 
-            if time.time() - last_pane_check >= pane_check_interval:
+            if now - last_pane_check >= pane_check_interval:
                 try:
-                    alive = bool(backend.is_alive(pane_id))
+                    alive = _PANE_LIVENESS.is_alive(backend, pane_id)
                 except Exception:
                     alive = False
                 if not alive:
+                    session.forget_pane_alive()
                     _write_log(f"[ERROR] Pane {pane_id} died during request session={self.session_key} req_id={task.req_id}")
                     return GaskdResult(
                         exit_code=1,
@@ -260,7 +337,13 @@ class _SessionWorker(BaseSessionWorker[_QueuedTask, GaskdResult]):
                         done_seen=False,
                         done_ms=None,
                     )
-                last_pane_check = time.time()
+                last_pane_check = now
+
+            # The reader polls the session file itself; come back here only when the next pane
+            # check (or the deadline) is due rather than on a fixed 1s cadence.
+            wait_step = max(0.05, last_pane_check + pane_check_interval - now)
+            if deadline is not None:
+                wait_step = min(deadline - now, wait_step)
 
             scan_from = state.get("msg_count")
             try:
@@ -325,14 +408,63 @@ class _SessionWorker(BaseSessionWorker[_QueuedTask, GaskdResult]):
 class _WorkerPool:
     def __init__(self):
         self._pool = PerSessionWorkerPool[_SessionWorker]()
+        # session file path -> (st_mtime_ns, st_size, session_key)
+        self._session_key_cache: dict[str, tuple[int, int, str]] = {}
+        # Opt-in: identical concurrent asks share one task (and therefore one req_id/reply).
+        self._dedup = (os.environ.get("CCB_GASKD_DEDUP") or "").strip().lower() in {"1", "true", "yes", "on"}
+        self._inflight: dict[tuple, _QueuedTask] = {}
+        self._inflight_lock = threading.Lock()
+
+    def _session_key_for(self, work_dir: Path) -> str:
+        session_file = find_project_session_file(work_dir)
+        if not session_file:
+            return "gemini:unknown"
+        cache_key = str(session_file)
+        try:
+            st = os.stat(cache_key)
+        except OSError:
+            self._session_key_cache.pop(cache_key, None)
+            return "gemini:unknown"
+        cached = self._session_key_cache.get(cache_key)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+
+        session = load_project_session(work_dir)
+        session_key = compute_session_key(session) if session else "gemini:unknown"
+        self._session_key_cache[cache_key] = (st.st_mtime_ns, st.st_size, session_key)
+        return session_key
 
     def submit(self, request: GaskdRequest) -> _QueuedTask:
+        session_key = self._session_key_for(Path(request.work_dir))
+        # Callers that pin a req_id expect their own round-trip, so never fold those.
+        if not self._dedup or request.req_id:
+            return self._enqueue(session_key, request)
+
+        digest = hashlib.blake2b(request.message.encode("utf-8"), digest_size=16).hexdigest()
+        # Only requests that would produce the same result may share a task.
+        key = (
+            session_key,
+            digest,
+            request.work_dir,
+            request.timeout_s,
+            request.quiet,
+            request.output_path,
+            request.caller,
+        )
+        with self._inflight_lock:
+            for k in [k for k, t in self._inflight.items() if t.done_event.is_set()]:
+                del self._inflight[k]
+            task = self._inflight.get(key)
+            if task is None:
+                task = self._enqueue(session_key, request)
+                self._inflight[key] = task
+            else:
+                _write_log(f"[INFO] dedup session={session_key} req_id={task.req_id}")
+        return task
+
+    def _enqueue(self, session_key: str, request: GaskdRequest) -> _QueuedTask:
         req_id = request.req_id or make_req_id()
         task = _QueuedTask(request=request, created_ms=_now_ms(), req_id=req_id, done_event=threading.Event())
-
-        session = load_project_session(Path(request.work_dir))
-        session_key = compute_session_key(session) if session else "gemini:unknown"
-
         worker = self._pool.get_or_create(session_key, _SessionWorker)
         worker.enqueue(task)
         return task
@@ -396,19 +528,14 @@ class GaskdServer:
         return server.serve_forever()
 
     def _cleanup_state_file(self) -> None:
+        flush_background_writes()
         try:
             st = read_state(self.state_file)
         except Exception:
             st = None
         try:
             if isinstance(st, dict) and int(st.get("pid") or 0) == os.getpid():
-                self.state_file.unlink(missing_ok=True)  # py3.8+: missing_ok
-        except TypeError:
-            try:
-                if isinstance(st, dict) and int(st.get("pid") or 0) == os.getpid() and self.state_file.exists():
-                    self.state_file.unlink()
-            except Exception:
-                pass
+                self.state_file.unlink(missing_ok=True)
         except Exception:
             pass
 
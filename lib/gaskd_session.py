@@ -6,6 +6,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional, Tuple
 
+from askd_runtime import pending_session_write, write_session_async
 from ccb_config import apply_backend_env
 from project_id import compute_ccb_project_id
 from session_utils import find_project_session_file as _find_project_session_file, safe_write_session
@@ -20,7 +21,9 @@ def find_project_session_file(work_dir: Path) -> Optional[Path]:
 
 def _read_json(path: Path) -> dict:
     try:
-        raw = path.read_text(encoding="utf-8-sig")
+        raw = pending_session_write(path)
+        if raw is None:
+            raw = path.read_text(encoding="utf-8-sig")
         obj = json.loads(raw)
         return obj if isinstance(obj, dict) else {}
     except Exception:
@@ -31,10 +34,18 @@ def _now_str() -> str:
     return time.strftime("%Y-%m-%d %H:%M:%S")
 
 
+# (session file, pane_id) -> time.monotonic() when the pane was last confirmed alive.
+# Back-to-back requests within the TTL skip the `tmux` fork behind backend.is_alive().
+_PANE_ALIVE_AT: dict[tuple[str, str], float] = {}
+_PANE_ALIVE_TTL_S = 0.5
+
+
 @dataclass
 class GeminiProjectSession:
     session_file: Path
     data: dict
+    # Daemon workers set this so write-backs go to the background writer instead of the request path.
+    defer_writes: bool = False
 
     @property
     def terminal(self) -> str:
@@ -80,14 +91,20 @@ class GeminiProjectSession:
             return False, "Terminal backend not available"
 
         pane_id = self.pane_id
-        if pane_id and backend.is_alive(pane_id):
-            return True, pane_id
+        if pane_id:
+            seen = _PANE_ALIVE_AT.get((str(self.session_file), pane_id))
+            if seen is not None and time.monotonic() - seen < _PANE_ALIVE_TTL_S:
+                return True, pane_id
+            if backend.is_alive(pane_id):
+                self._mark_pane_alive(pane_id)
+                return True, pane_id
 
         marker = self.pane_title_marker
         resolver = getattr(backend, "find_pane_by_title_marker", None)
         if marker and callable(resolver):
             resolved = resolver(marker)
             if resolved and backend.is_alive(str(resolved)):
+                self._mark_pane_alive(str(resolved))
                 self.data["pane_id"] = str(resolved)
                 self.data["updated_at"] = _now_str()
                 self._write_back()
@@ -117,6 +134,7 @@ class GeminiProjectSession:
                                 pass
                         respawn(str(target), cmd=start_cmd, cwd=self.work_dir, remain_on_exit=True)
                         if backend.is_alive(str(target)):
+                            self._mark_pane_alive(str(target))
                             self.data["pane_id"] = str(target)
                             self.data["updated_at"] = _now_str()
                             self._write_back()
@@ -129,6 +147,13 @@ class GeminiProjectSession:
 
         return False, f"Pane not alive: {pane_id}"
 
+    def _mark_pane_alive(self, pane_id: str) -> None:
+        _PANE_ALIVE_AT[(str(self.session_file), pane_id)] = time.monotonic()
+
+    def forget_pane_alive(self) -> None:
+        """Drop the cached liveness so the next ensure_pane() asks the backend again."""
+        _PANE_ALIVE_AT.pop((str(self.session_file), self.pane_id), None)
+
     def update_gemini_binding(self, *, session_path: Optional[Path], session_id: Optional[str]) -> None:
         updated = False
         if session_path:
@@ -169,6 +194,9 @@ class GeminiProjectSession:
 
     def _write_back(self) -> None:
         payload = json.dumps(self.data, ensure_ascii=False, indent=2) + "\n"
+        if self.defer_writes:
+            write_session_async(self.session_file, payload)
+            return
         ok, _err = safe_write_session(self.session_file, payload)
         if not ok:
             return
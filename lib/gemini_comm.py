@@ -5,9 +5,11 @@ Supports tmux and WezTerm terminals, reads replies from ~/.gemini/tmp/<hash>/cha
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import json
 import os
+import re
 import sys
 import time
 from pathlib import Path
@@ -23,6 +25,45 @@ from project_id import compute_ccb_project_id
 apply_backend_env()
 
 GEMINI_ROOT = Path(os.environ.get("GEMINI_ROOT") or (Path.home() / ".gemini" / "tmp")).expanduser()
+_CHATS_DIR_TTL_S = 5.0
+_HEALTH_CACHE_TTL_S = 1.0
+
+
+# Parsed .gemini-session files keyed by path, invalidated by (mtime_ns, size).
+# Callers get a shallow copy they may modify; large files are not cached.
+_PROJECT_JSON_CACHE: Dict[str, Tuple[int, int, dict]] = {}
+_PROJECT_JSON_CACHE_MAX = 16
+_PROJECT_JSON_CACHE_MAX_BYTES = 1024 * 1024
+
+
+def _load_project_json(path: Path) -> Optional[dict]:
+    """Read a project session file (dict or None), reusing the last parse while the file is unchanged."""
+    key = os.fspath(path)
+    try:
+        st = os.stat(key)
+    except OSError:
+        _PROJECT_JSON_CACHE.pop(key, None)
+        return None
+    cached = _PROJECT_JSON_CACHE.get(key)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return dict(cached[2])
+    try:
+        data = json.loads(Path(key).read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict):
+        return None
+    _PROJECT_JSON_CACHE.pop(key, None)
+    if st.st_size <= _PROJECT_JSON_CACHE_MAX_BYTES:
+        while len(_PROJECT_JSON_CACHE) >= _PROJECT_JSON_CACHE_MAX:
+            _PROJECT_JSON_CACHE.pop(next(iter(_PROJECT_JSON_CACHE)), None)
+        # Keyed by the stat taken before reading: a concurrent rewrite only causes a re-parse.
+        _PROJECT_JSON_CACHE[key] = (st.st_mtime_ns, st.st_size, data)
+    return dict(data)
+
+
+def _forget_project_json(path: Path) -> None:
+    _PROJECT_JSON_CACHE.pop(os.fspath(path), None)
 
 
 def _get_project_hash(work_dir: Optional[Path] = None) -> str:
@@ -37,6 +78,216 @@ def _get_project_hash(work_dir: Optional[Path] = None) -> str:
     return hashlib.sha256(normalized.encode()).hexdigest()
 
 
+def _content_hash(content: str) -> str:
+    """
+    Change-detection token for a reply body, stored as `last_gemini_hash` in reader state.
+
+    Only ever compared with tokens from the same process, so the builtin str hash is enough:
+    it runs over the string in place (no UTF-8 encode copy) and is much cheaper than SHA-256.
+    The length is folded in to make a false "unchanged" even less likely.
+    """
+    return f"{len(content):x}:{hash(content) & 0xFFFFFFFFFFFFFFFF:016x}"
+
+
+def _env_flag(name: str) -> bool:
+    return os.environ.get(name) in ("1", "true", "yes")
+
+
+_JSON_READ_ATTEMPTS = 5
+
+
+def load_json_file(path: Path, stat: Optional[os.stat_result] = None) -> Any:
+    """
+    Parse a JSON file that Gemini CLI may be rewriting in place.
+
+    A failed parse is retried right away when the file changed since the stat taken before
+    the read (the writer has moved on); otherwise after a short exponential backoff (5 ms up
+    to 50 ms). Returns None when the file is missing or still unparseable after the retries.
+    """
+    for attempt in range(_JSON_READ_ATTEMPTS):
+        if stat is None:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                return None
+        try:
+            # Parsed from bytes; a write torn mid-character surfaces as UnicodeDecodeError (a ValueError).
+            return json.loads(path.read_bytes())
+        except ValueError:
+            pass
+        except OSError:
+            return None
+        if attempt == _JSON_READ_ATTEMPTS - 1:
+            break
+        try:
+            current = os.stat(path)
+        except OSError:
+            return None
+        if current.st_mtime_ns == stat.st_mtime_ns and current.st_size == stat.st_size:
+            time.sleep(min(0.005 * 2 ** attempt, 0.05))
+            current = None
+        stat = current
+    return None
+
+
+def _reader_state(
+    session: Optional[Path],
+    msg_count: int,
+    mtime: float,
+    mtime_ns: int,
+    size: int,
+    last_gemini_id: Optional[str],
+    last_gemini_hash: Optional[str],
+    reuse: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Build the state dict handed back by GeminiLogReader.capture_state/_read_since.
+
+    Idle polls mostly time out with nothing changed; pass the caller's state as `reuse` and it
+    is returned as-is in that case instead of allocating an identical dict.
+    """
+    if reuse is not None and (
+        reuse.get("session_path") == session
+        and reuse.get("msg_count") == msg_count
+        and reuse.get("mtime_ns") == mtime_ns
+        and reuse.get("size") == size
+        and reuse.get("last_gemini_id") == last_gemini_id
+        and reuse.get("last_gemini_hash") == last_gemini_hash
+    ):
+        return reuse
+    return {
+        "session_path": session,
+        "msg_count": msg_count,
+        "mtime": mtime,
+        "mtime_ns": mtime_ns,
+        "size": size,
+        "last_gemini_id": last_gemini_id,
+        "last_gemini_hash": last_gemini_hash,
+    }
+
+
+_SESSION_ID_RE = re.compile(rb'"sessionId"\s*:\s*"([^"\\]+)"')
+
+
+def _read_session_id_from_head(session_path: Path) -> str:
+    """
+    Read `sessionId` from the first few KB of a Gemini session file.
+
+    Gemini CLI writes sessionId ahead of the (potentially multi-MB) messages array, so the full
+    document does not need to be parsed for it. Only the part before "messages" is searched;
+    returns "" when not found there, and callers fall back to a full parse.
+    """
+    try:
+        with open(session_path, "rb") as handle:
+            head = handle.read(4096)
+    except OSError:
+        return ""
+    end = head.find(b'"messages"')
+    match = _SESSION_ID_RE.search(head if end < 0 else head[:end])
+    return match.group(1).decode("utf-8", errors="replace") if match else ""
+
+
+# Below this size a full parse is cheap enough; above it latest_message() scans from the tail.
+_TAIL_PARSE_MIN_BYTES = 256 * 1024
+# The tail window starts at _TAIL_PARSE_MIN_BYTES and grows 4x up to this before giving up.
+_TAIL_WINDOW_MAX_BYTES = 16 * 1024 * 1024
+# JSON strings (escapes included) and braces; everything else is skipped when matching braces.
+_JSON_BRACE_TOKEN_RE = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|[{}]')
+_WS = b" \t\r\n"
+
+
+def _object_end(buf, start: int) -> int:
+    """Return the offset just past the JSON object opening at buf[start], or -1."""
+    depth = 0
+    for match in _JSON_BRACE_TOKEN_RE.finditer(buf, start):
+        token = match.group()
+        if token == b"{":
+            depth += 1
+        elif token == b"}":
+            depth -= 1
+            if depth == 0:
+                return match.end()
+    return -1
+
+
+def _last_gemini_type_marker(buf) -> int:
+    """Offset of the last `"type": "gemini"` key/value in buf, or -1."""
+    end = len(buf)
+    while True:
+        pos = buf.rfind(b'"gemini"', 0, end)
+        if pos < 0:
+            return -1
+        j = pos
+        while j > 0 and buf[j - 1 : j] in _WS:
+            j -= 1
+        if buf[j - 1 : j] == b":":
+            j -= 1
+            while j > 0 and buf[j - 1 : j] in _WS:
+                j -= 1
+            if buf[max(0, j - 6) : j] == b'"type"' and buf[max(0, j - 7) : j - 6] != b"\\":
+                return j - 6
+        end = pos
+
+
+def _last_gemini_in(buf: bytes) -> Tuple[Optional[Tuple[Optional[str], str]], bool]:
+    """
+    Locate and parse the last Gemini message object inside buf.
+
+    Returns (message, grow): grow is True when buf may simply be too short (no marker, or the
+    enclosing `{` lies before its start); (None, False) means the layout is not recognised.
+    """
+    marker = _last_gemini_type_marker(buf)
+    if marker < 0:
+        return None, True
+    limit = marker
+    for _ in range(64):
+        start = buf.rfind(b"{", 0, limit)
+        if start < 0:
+            return None, True
+        end = _object_end(buf, start)
+        if end > marker:
+            try:
+                msg = json.loads(buf[start:end])
+            except ValueError:
+                msg = None  # The `{` was inside a string value; keep walking back.
+            if isinstance(msg, dict):
+                if msg.get("type") != "gemini":
+                    return None, False
+                content = msg.get("content", "")
+                if not isinstance(content, str):
+                    content = str(content)
+                return (msg.get("id"), content.strip()), False
+        # Otherwise a nested object that closes before the marker; keep walking back.
+        limit = start
+    return None, False
+
+
+def _read_last_gemini_from_tail(session: Path) -> Optional[Tuple[Optional[str], str]]:
+    """
+    Find the last Gemini message of a large session file without parsing the whole document.
+
+    Reads a bounded window from the end of the file (growing it while no complete message is
+    found), locates the last `"type": "gemini"` marker, walks back to the `{` of the object that
+    encloses it and parses just that object. The window is read into memory rather than mapped:
+    Gemini CLI rewrites the file in place, and a truncation under a live mmap raises SIGBUS.
+    Returns None when the layout is not recognised; callers then fall back to a full parse.
+    """
+    try:
+        with open(session, "rb") as handle:
+            size = os.fstat(handle.fileno()).st_size
+            window = _TAIL_PARSE_MIN_BYTES
+            while True:
+                offset = max(0, size - window)
+                handle.seek(offset)
+                buf = handle.read(size - offset)
+                found, grow = _last_gemini_in(buf)
+                if found is not None or not grow or offset == 0 or window >= _TAIL_WINDOW_MAX_BYTES:
+                    return found
+                window *= 4
+    except OSError:
+        return None
+
+
 class GeminiLogReader:
     """Reads Gemini session files from ~/.gemini/tmp/<hash>/chats"""
 
@@ -46,6 +297,10 @@ class GeminiLogReader:
         forced_hash = os.environ.get("GEMINI_PROJECT_HASH", "").strip()
         self._project_hash = forced_hash or _get_project_hash(self.work_dir)
         self._preferred_session: Optional[Path] = None
+        # (project_hash, time.monotonic() when verified, chats dir)
+        self._chats_dir_cache: Optional[Tuple[str, float, Path]] = None
+        # ((session path, size), last 4 KB) as of the last same-size parse; see _read_since.
+        self._tail_seen: Optional[Tuple[Tuple[str, int], bytes]] = None
         try:
             poll = float(os.environ.get("GEMINI_POLL_INTERVAL", "0.05"))
         except Exception:
@@ -58,63 +313,112 @@ class GeminiLogReader:
         except Exception:
             force = 1.0
         self._force_read_interval = min(5.0, max(0.2, force))
-
-    @staticmethod
-    def _debug_enabled() -> bool:
-        return os.environ.get("CCB_DEBUG") in ("1", "true", "yes") or os.environ.get("GPEND_DEBUG") in ("1", "true", "yes")
-
-    @classmethod
-    def _debug(cls, message: str) -> None:
-        if not cls._debug_enabled():
+        # While the session file stays unchanged, back off from _poll_interval up to this cap;
+        # any change resets it, so active replies are still picked up at the base rate.
+        try:
+            idle_max = float(os.environ.get("GEMINI_IDLE_POLL_MAX", "0.25"))
+        except Exception:
+            idle_max = 0.25
+        self._idle_poll_max = max(self._poll_interval, min(1.0, idle_max))
+        # Current idle backoff. Kept across wait_for_message() calls so callers that wait in
+        # short slices (gaskd, the unbounded ask_sync loop) don't restart at the base rate
+        # every slice; capture_state() resets it for a new request.
+        self._idle_sleep = self._poll_interval
+        # Env-driven flags are read once per reader instead of on every poll.
+        self._debug_flag = _env_flag("CCB_DEBUG") or _env_flag("GPEND_DEBUG")
+        self._any_project_scan = _env_flag("GEMINI_ALLOW_ANY_PROJECT_SCAN")
+
+    def _debug(self, message: str) -> None:
+        if not self._debug_flag:
             return
         print(f"[DEBUG] {message}", file=sys.stderr)
 
     def _chats_dir(self) -> Optional[Path]:
+        # The chats dir rarely changes once it exists; re-verify it only every few seconds.
+        # Misses are not cached so a freshly created dir is picked up on the next poll.
+        now = time.monotonic()
+        cached = self._chats_dir_cache
+        if cached and cached[0] == self._project_hash and now - cached[1] < _CHATS_DIR_TTL_S:
+            return cached[2]
         chats = self.root / self._project_hash / "chats"
-        return chats if chats.exists() else None
+        if not chats.is_dir():
+            self._chats_dir_cache = None
+            return None
+        self._chats_dir_cache = (self._project_hash, now, chats)
+        return chats
+
+    @staticmethod
+    def _latest_in_chats_dir(chats: str) -> Tuple[Optional[str], float]:
+        """Return (path, mtime) of the newest session-*.json in `chats` using one scandir pass."""
+        best: Optional[str] = None
+        best_mtime = 0.0
+        try:
+            with os.scandir(chats) as it:
+                for entry in it:
+                    name = entry.name
+                    # Filter on the name first so only candidate files are stat'ed.
+                    if not (name.startswith("session-") and name.endswith(".json")):
+                        continue
+                    try:
+                        if not entry.is_file():
+                            continue
+                        mtime = entry.stat().st_mtime
+                    except OSError:
+                        continue
+                    if best is None or mtime >= best_mtime:
+                        best, best_mtime = entry.path, mtime
+        except OSError:
+            return None, 0.0
+        return best, best_mtime
 
     def _scan_latest_session_any_project(self) -> Optional[Path]:
         """Scan latest session across all projectHash (fallback for Windows/WSL path hash mismatch)"""
-        if not self.root.exists():
-            return None
+        best: Optional[str] = None
+        best_mtime = 0.0
         try:
-            sessions = sorted(
-                (p for p in self.root.glob("*/chats/session-*.json") if p.is_file() and not p.name.startswith(".")),
-                key=lambda p: p.stat().st_mtime,
-            )
+            with os.scandir(self.root) as it:
+                project_dirs = [entry.path for entry in it if entry.is_dir()]
         except OSError:
             return None
-        return sessions[-1] if sessions else None
+        for project_dir in project_dirs:
+            path, mtime = self._latest_in_chats_dir(os.path.join(project_dir, "chats"))
+            if path and (best is None or mtime >= best_mtime):
+                best, best_mtime = path, mtime
+        return Path(best) if best else None
 
     def _scan_latest_session(self) -> Optional[Path]:
         chats = self._chats_dir()
-        try:
-            if chats:
-                sessions = sorted(
-                    (p for p in chats.glob("session-*.json") if p.is_file() and not p.name.startswith(".")),
-                    key=lambda p: p.stat().st_mtime,
-                )
-            else:
-                sessions = []
-        except OSError:
-            sessions = []
-
-        if sessions:
-            return sessions[-1]
-
-        return None
+        if not chats:
+            return None
+        path, _mtime = self._latest_in_chats_dir(os.fspath(chats))
+        if not path:
+            # Empty or vanished dir: drop the cached entry so the next scan re-verifies it.
+            self._chats_dir_cache = None
+            return None
+        # Usually the newest file is the one already bound: hand back that Path instead of a new one,
+        # which also makes the caller's `!=` check an identity hit.
+        preferred = self._preferred_session
+        if preferred is not None and os.fspath(preferred) == path:
+            return preferred
+        return Path(path)
 
     def _latest_session(self) -> Optional[Path]:
         preferred = self._preferred_session
         # Always scan to find the latest session by mtime
         scanned = self._scan_latest_session()
 
-        # Compare preferred vs scanned by mtime - use whichever is newer
-        if preferred and preferred.exists():
-            if scanned and scanned.exists():
+        # Compare preferred vs scanned by mtime - use whichever is newer.
+        # A failed stat doubles as the existence check (no separate exists() calls).
+        pref_mtime: Optional[float] = None
+        if preferred:
+            try:
+                pref_mtime = os.stat(preferred).st_mtime
+            except OSError:
+                pref_mtime = None
+        if preferred and pref_mtime is not None:
+            if scanned and scanned != preferred:
                 try:
-                    pref_mtime = preferred.stat().st_mtime
-                    scan_mtime = scanned.stat().st_mtime
+                    scan_mtime = os.stat(scanned).st_mtime
                     if scan_mtime > pref_mtime:
                         self._debug(f"Scanned session newer: {scanned} ({scan_mtime}) > {preferred} ({pref_mtime})")
                         self._preferred_session = scanned
@@ -129,7 +433,7 @@ class GeminiLogReader:
             self._debug(f"Scan found: {scanned}")
             return scanned
         # Strict by default: only scan this project's hash. Opt-in to any-project scan if needed.
-        if os.environ.get("GEMINI_ALLOW_ANY_PROJECT_SCAN") in ("1", "true", "yes"):
+        if self._any_project_scan:
             any_latest = self._scan_latest_session_any_project()
             if any_latest:
                 self._preferred_session = any_latest
@@ -156,30 +460,21 @@ class GeminiLogReader:
     def current_session_path(self) -> Optional[Path]:
         return self._latest_session()
 
-    def _read_session_json(self, session: Path) -> Optional[dict]:
+    def _read_session_json(self, session: Path, stat: Optional[os.stat_result] = None) -> Optional[dict]:
         """
-        Read a Gemini session JSON file with retries.
+        Read a Gemini session JSON file, retrying transient in-place write failures.
 
-        Gemini CLI may write the session file in-place, causing transient JSONDecodeError.
+        Pass the stat already taken by the caller (if any) so an unchanged file is not re-read
+        blindly; see load_json_file.
         """
-        if not session or not session.exists():
+        if not session:
             return None
-        for attempt in range(10):
-            try:
-                with session.open("r", encoding="utf-8") as f:
-                    loaded = json.load(f)
-                return loaded if isinstance(loaded, dict) else None
-            except json.JSONDecodeError:
-                # Transient partial write; retry briefly.
-                if attempt < 9:
-                    time.sleep(min(self._poll_interval, 0.05))
-                continue
-            except OSError:
-                return None
-        return None
+        loaded = load_json_file(session, stat)
+        return loaded if isinstance(loaded, dict) else None
 
     def capture_state(self) -> Dict[str, Any]:
         """Record current session file and message count"""
+        self._idle_sleep = self._poll_interval
         session = self._latest_session()
         msg_count = 0
         mtime = 0.0
@@ -187,17 +482,18 @@ class GeminiLogReader:
         size = 0
         last_gemini_id: Optional[str] = None
         last_gemini_hash: Optional[str] = None
-        if session and session.exists():
-            data: Optional[dict] = None
+        stat = None
+        if session:
             try:
-                stat = session.stat()
-                mtime = stat.st_mtime
-                mtime_ns = getattr(stat, "st_mtime_ns", int(stat.st_mtime * 1_000_000_000))
-                size = stat.st_size
+                stat = os.stat(session)
             except OSError:
                 stat = None
+        if stat is not None:
+            mtime = stat.st_mtime
+            mtime_ns = getattr(stat, "st_mtime_ns", int(stat.st_mtime * 1_000_000_000))
+            size = stat.st_size
 
-            data = self._read_session_json(session)
+            data = self._read_session_json(session, stat)
 
             if data is None:
                 # Unknown baseline (parse failed). Let the wait loop establish a stable baseline first.
@@ -207,16 +503,8 @@ class GeminiLogReader:
                 last = self._extract_last_gemini(data)
                 if last:
                     last_gemini_id, content = last
-                    last_gemini_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
-        return {
-            "session_path": session,
-            "msg_count": msg_count,
-            "mtime": mtime,
-            "mtime_ns": mtime_ns,
-            "size": size,
-            "last_gemini_id": last_gemini_id,
-            "last_gemini_hash": last_gemini_hash,
-        }
+                    last_gemini_hash = _content_hash(content)
+        return _reader_state(session, msg_count, mtime, mtime_ns, size, last_gemini_id, last_gemini_hash)
 
     def wait_for_message(self, state: Dict[str, Any], timeout: float) -> Tuple[Optional[str], Dict[str, Any]]:
         """Block and wait for new Gemini reply"""
@@ -229,19 +517,20 @@ class GeminiLogReader:
     def latest_message(self) -> Optional[str]:
         """Get the latest Gemini reply directly"""
         session = self._latest_session()
-        if not session or not session.exists():
+        if session:
+            try:
+                large = os.stat(session).st_size > _TAIL_PARSE_MIN_BYTES
+            except OSError:
+                large = False
+            if large:
+                last = _read_last_gemini_from_tail(session)
+                if last:
+                    return last[1]
+        data = self._read_session_json(session)
+        if not isinstance(data, dict):
             return None
-        try:
-            data = self._read_session_json(session)
-            if not isinstance(data, dict):
-                return None
-            messages = data.get("messages", [])
-            for msg in reversed(messages):
-                if msg.get("type") == "gemini":
-                    return msg.get("content", "").strip()
-        except (OSError, json.JSONDecodeError):
-            pass
-        return None
+        last = self._extract_last_gemini(data)
+        return last[1] if last else None
 
     def latest_conversations(self, n: int = 1) -> List[Tuple[str, str]]:
         """Get the latest n conversations (question, reply) pairs"""
@@ -276,7 +565,8 @@ class GeminiLogReader:
         return conversations[-n:] if len(conversations) > n else conversations
 
     def _read_since(self, state: Dict[str, Any], timeout: float, block: bool) -> Tuple[Optional[str], Dict[str, Any]]:
-        deadline = time.time() + timeout
+        # Monotonic clock, read once per iteration (and again only after sleeping).
+        deadline = time.monotonic() + timeout
         prev_count = state.get("msg_count", 0)
         unknown_baseline = isinstance(prev_count, int) and prev_count < 0
         prev_mtime = state.get("mtime", 0.0)
@@ -289,12 +579,13 @@ class GeminiLogReader:
         prev_last_gemini_hash = state.get("last_gemini_hash")
         # Allow short timeout to scan new session files (sync tools may use short poll windows)
         rescan_interval = min(2.0, max(0.2, timeout / 2.0))
-        last_rescan = time.time()
-        last_forced_read = time.time()
+        last_rescan = last_forced_read = time.monotonic()
+        resolved = False
 
         while True:
+            now = time.monotonic()
             # Periodically rescan to detect new session files
-            if time.time() - last_rescan >= rescan_interval:
+            if now - last_rescan >= rescan_interval:
                 latest = self._scan_latest_session()
                 if latest and latest != self._preferred_session:
                     self._preferred_session = latest
@@ -305,51 +596,65 @@ class GeminiLogReader:
                         prev_size = 0
                         prev_last_gemini_id = None
                         prev_last_gemini_hash = None
-                last_rescan = time.time()
-
-            session = self._latest_session()
-            if not session or not session.exists():
+                last_rescan = now
+
+            # Resolve the session (directory listing + mtime compare) once; after that only the
+            # periodic rescan above lists the chats dir and the loop polls the bound file.
+            session = self._preferred_session if resolved else None
+            if session is None:
+                session = self._latest_session()
+                resolved = True
+            # One stat per iteration: it doubles as the existence check and the change signal.
+            stat = None
+            if session:
+                try:
+                    stat = os.stat(session)
+                except OSError:
+                    stat = None
+            if stat is None:
                 if not block:
-                    return None, {
-                        "session_path": None,
-                        "msg_count": 0,
-                        "mtime": 0.0,
-                        "size": 0,
-                        "last_gemini_id": prev_last_gemini_id,
-                        "last_gemini_hash": prev_last_gemini_hash,
-                    }
+                    return None, _reader_state(None, 0, 0.0, 0, 0, prev_last_gemini_id, prev_last_gemini_hash)
                 time.sleep(self._poll_interval)
-                if time.time() >= deadline:
+                if time.monotonic() >= deadline:
                     return None, state
                 continue
 
             try:
-                stat = session.stat()
                 current_mtime = stat.st_mtime
                 current_mtime_ns = getattr(stat, "st_mtime_ns", int(current_mtime * 1_000_000_000))
                 current_size = stat.st_size
                 # On Windows/WSL, mtime may have second-level precision, which can miss rapid writes.
                 # Use file size as additional change signal.
-                if block and current_mtime_ns <= prev_mtime_ns and current_size == prev_size:
-                    if time.time() - last_forced_read < self._force_read_interval:
-                        time.sleep(self._poll_interval)
-                        if time.time() >= deadline:
-                            return None, {
-                                "session_path": session,
-                                "msg_count": prev_count,
-                                "mtime": prev_mtime,
-                                "mtime_ns": prev_mtime_ns,
-                                "size": prev_size,
-                                "last_gemini_id": prev_last_gemini_id,
-                                "last_gemini_hash": prev_last_gemini_hash,
-                            }
+                unchanged = current_mtime_ns <= prev_mtime_ns and current_size == prev_size
+                if block and not unchanged and current_size == prev_size and not unknown_baseline:
+                    # Same size, newer mtime: usually only `lastUpdated` near the head was rewritten.
+                    # Replies land at the end of the file, so compare the tail before a full parse.
+                    tail = self._read_tail(session, current_size)
+                    tail_key = (os.fspath(session), current_size)
+                    if tail is not None and self._tail_seen == (tail_key, tail):
+                        prev_mtime = current_mtime
+                        prev_mtime_ns = current_mtime_ns
+                        unchanged = True
+                    else:
+                        self._tail_seen = (tail_key, tail) if tail is not None else None
+                if block and unchanged:
+                    if now - last_forced_read < self._force_read_interval:
+                        time.sleep(max(0.0, min(self._idle_sleep, deadline - now)))
+                        self._idle_sleep = min(self._idle_poll_max, self._idle_sleep * 1.5)
+                        if time.monotonic() >= deadline:
+                            return None, _reader_state(
+                                session, prev_count, prev_mtime, prev_mtime_ns, prev_size,
+                                prev_last_gemini_id, prev_last_gemini_hash, reuse=state,
+                            )
                         continue
                     # fallthrough: forced read
+                else:
+                    self._idle_sleep = self._poll_interval
 
-                data = self._read_session_json(session)
+                data = self._read_session_json(session, stat)
                 if data is None:
                     raise json.JSONDecodeError("Gemini session JSON is incomplete", "", 0)
-                last_forced_read = time.time()
+                last_forced_read = now
                 messages = data.get("messages", [])
                 current_count = len(messages)
 
@@ -373,16 +678,11 @@ class GeminiLogReader:
                         and (current_mtime_ns > prev_mtime_ns or current_size != prev_size)
                     ):
                         msg_id = last_msg.get("id") if isinstance(last_msg, dict) else None
-                        content_hash = hashlib.sha256(last_content.encode("utf-8")).hexdigest()
-                        return last_content, {
-                            "session_path": session,
-                            "msg_count": current_count,
-                            "mtime": current_mtime,
-                            "mtime_ns": current_mtime_ns,
-                            "size": current_size,
-                            "last_gemini_id": msg_id,
-                            "last_gemini_hash": content_hash,
-                        }
+                        content_hash = _content_hash(last_content)
+                        return last_content, _reader_state(
+                            session, current_count, current_mtime, current_mtime_ns, current_size,
+                            msg_id, content_hash,
+                        )
 
                     prev_mtime = current_mtime
                     prev_mtime_ns = current_mtime_ns
@@ -391,29 +691,19 @@ class GeminiLogReader:
                     last = self._extract_last_gemini(data)
                     if last:
                         prev_last_gemini_id, content = last
-                        prev_last_gemini_hash = hashlib.sha256(content.encode("utf-8")).hexdigest() if content else None
+                        prev_last_gemini_hash = _content_hash(content) if content else None
                     unknown_baseline = False
                     if not block:
-                        return None, {
-                            "session_path": session,
-                            "msg_count": prev_count,
-                            "mtime": prev_mtime,
-                            "mtime_ns": prev_mtime_ns,
-                            "size": prev_size,
-                            "last_gemini_id": prev_last_gemini_id,
-                            "last_gemini_hash": prev_last_gemini_hash,
-                        }
+                        return None, _reader_state(
+                            session, prev_count, prev_mtime, prev_mtime_ns, prev_size,
+                            prev_last_gemini_id, prev_last_gemini_hash, reuse=state,
+                        )
                     time.sleep(self._poll_interval)
-                    if time.time() >= deadline:
-                        return None, {
-                            "session_path": session,
-                            "msg_count": prev_count,
-                            "mtime": prev_mtime,
-                            "mtime_ns": prev_mtime_ns,
-                            "size": prev_size,
-                            "last_gemini_id": prev_last_gemini_id,
-                            "last_gemini_hash": prev_last_gemini_hash,
-                        }
+                    if time.monotonic() >= deadline:
+                        return None, _reader_state(
+                            session, prev_count, prev_mtime, prev_mtime_ns, prev_size,
+                            prev_last_gemini_id, prev_last_gemini_hash, reuse=state,
+                        )
                     continue
 
                 if current_count > prev_count:
@@ -426,23 +716,19 @@ class GeminiLogReader:
                         if msg.get("type") == "gemini":
                             content = msg.get("content", "").strip()
                             if content:
-                                content_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
                                 msg_id = msg.get("id")
-                                if msg_id == prev_last_gemini_id and content_hash == prev_last_gemini_hash:
+                                # Only a message with the previous id can be the reply already seen;
+                                # others need no hash until one is picked as the result.
+                                if msg_id == prev_last_gemini_id and _content_hash(content) == prev_last_gemini_hash:
                                     continue
                                 last_gemini_content = content
                                 last_gemini_id = msg_id
-                                last_gemini_hash = content_hash
                     if last_gemini_content:
-                        new_state = {
-                            "session_path": session,
-                            "msg_count": current_count,
-                            "mtime": current_mtime,
-                            "mtime_ns": current_mtime_ns,
-                            "size": current_size,
-                            "last_gemini_id": last_gemini_id,
-                            "last_gemini_hash": last_gemini_hash,
-                        }
+                        last_gemini_hash = _content_hash(last_gemini_content)
+                        new_state = _reader_state(
+                            session, current_count, current_mtime, current_mtime_ns, current_size,
+                            last_gemini_id, last_gemini_hash,
+                        )
                         return last_gemini_content, new_state
                 else:
                     # Some versions write empty gemini message first, then update content in-place.
@@ -450,53 +736,50 @@ class GeminiLogReader:
                     if last:
                         last_id, content = last
                         if content:
-                            current_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+                            current_hash = _content_hash(content)
                             if last_id != prev_last_gemini_id or current_hash != prev_last_gemini_hash:
-                                new_state = {
-                                    "session_path": session,
-                                    "msg_count": current_count,
-                                    "mtime": current_mtime,
-                                    "mtime_ns": current_mtime_ns,
-                                    "size": current_size,
-                                    "last_gemini_id": last_id,
-                                    "last_gemini_hash": current_hash,
-                                }
+                                new_state = _reader_state(
+                                    session, current_count, current_mtime, current_mtime_ns, current_size,
+                                    last_id, current_hash,
+                                )
                                 return content, new_state
+                        # Nothing new to report; the hash computed above already matches the baseline.
+                        prev_last_gemini_id = last_id
 
                 prev_mtime = current_mtime
                 prev_mtime_ns = current_mtime_ns
-                prev_count = current_count
                 prev_size = current_size
-                last = self._extract_last_gemini(data)
-                if last:
-                    prev_last_gemini_id, content = last
-                    prev_last_gemini_hash = hashlib.sha256(content.encode("utf-8")).hexdigest() if content else prev_last_gemini_hash
+                if current_count > prev_count:
+                    last = self._extract_last_gemini(data)
+                    if last:
+                        prev_last_gemini_id, content = last
+                        prev_last_gemini_hash = _content_hash(content) if content else prev_last_gemini_hash
+                prev_count = current_count
 
             except (OSError, json.JSONDecodeError):
                 pass
 
             if not block:
-                return None, {
-                    "session_path": session,
-                    "msg_count": prev_count,
-                    "mtime": prev_mtime,
-                    "mtime_ns": prev_mtime_ns,
-                    "size": prev_size,
-                    "last_gemini_id": prev_last_gemini_id,
-                    "last_gemini_hash": prev_last_gemini_hash,
-                }
+                return None, _reader_state(
+                    session, prev_count, prev_mtime, prev_mtime_ns, prev_size,
+                    prev_last_gemini_id, prev_last_gemini_hash, reuse=state,
+                )
 
             time.sleep(self._poll_interval)
-            if time.time() >= deadline:
-                return None, {
-                    "session_path": session,
-                    "msg_count": prev_count,
-                    "mtime": prev_mtime,
-                    "mtime_ns": prev_mtime_ns,
-                    "size": prev_size,
-                    "last_gemini_id": prev_last_gemini_id,
-                    "last_gemini_hash": prev_last_gemini_hash,
-                }
+            if time.monotonic() >= deadline:
+                return None, _reader_state(
+                    session, prev_count, prev_mtime, prev_mtime_ns, prev_size,
+                    prev_last_gemini_id, prev_last_gemini_hash, reuse=state,
+                )
+
+    @staticmethod
+    def _read_tail(session: Path, size: int, length: int = 4096) -> Optional[bytes]:
+        try:
+            with open(session, "rb") as handle:
+                handle.seek(max(0, size - length))
+                return handle.read(length)
+        except OSError:
+            return None
 
     @staticmethod
     def _extract_last_gemini(payload: dict) -> Optional[Tuple[Optional[str], str]]:
@@ -515,6 +798,13 @@ class GeminiLogReader:
         return None
 
 
+@functools.lru_cache(maxsize=8)
+def _env_gemini_session_path(raw: str) -> Optional[Path]:
+    """Expanded CCB_SESSION_FILE path if it names a .gemini-session file (keyed by the raw env value)."""
+    session_path = Path(os.path.expanduser(raw))
+    return session_path if session_path.name == ".gemini-session" else None
+
+
 class GeminiCommunicator:
     """Communicate with Gemini via terminal and read replies from session files"""
 
@@ -529,37 +819,39 @@ class GeminiCommunicator:
         self.pane_id = get_pane_id_from_session(self.session_info)
         self.pane_title_marker = self.session_info.get("pane_title_marker") or ""
         self.timeout = int(os.environ.get("GEMINI_SYNC_TIMEOUT", "60"))
+        # Seconds between "Still waiting..." hints (and wait slices) when ask_sync has no timeout.
+        self._progress_interval = 60
         self.marker_prefix = "ask"
+        self._pid = os.getpid()
         self.project_session_file = self.session_info.get("_session_file")
+        self._project_file_path = Path(self.project_session_file) if self.project_session_file else None
         self.backend = get_backend_for_session(self.session_info)
+        work_dir_hint = self.session_info.get("work_dir")
+        self._work_dir_hint: Optional[str] = work_dir_hint if isinstance(work_dir_hint, str) and work_dir_hint else None
+        self._preferred_session_path = self.session_info.get("gemini_session_path") or self.session_info.get("session_path")
+
+        # Serialized form of the last registry record published by this communicator.
+        self._last_registry_key: Optional[str] = None
 
         # Best-effort: publish to registry for project_id routing.
         try:
-            wd = self.session_info.get("work_dir")
-            ccb_pid = compute_ccb_project_id(Path(wd)) if isinstance(wd, str) and wd else ""
-            upsert_registry(
-                {
-                    "ccb_session_id": self.session_id,
-                    "ccb_project_id": ccb_pid or None,
-                    "work_dir": wd,
-                    "terminal": self.terminal,
-                    "providers": {
-                        "gemini": {
-                            "pane_id": self.pane_id or None,
-                            "pane_title_marker": self.session_info.get("pane_title_marker"),
-                            "session_file": self.project_session_file,
-                            "gemini_session_id": self.session_info.get("gemini_session_id"),
-                            "gemini_session_path": self.session_info.get("gemini_session_path") or self.session_info.get("session_path"),
-                        }
-                    },
-                }
+            ccb_pid = compute_ccb_project_id(Path(self._work_dir_hint)) if self._work_dir_hint else ""
+            self._publish_registry(
+                self._build_registry_payload(
+                    self.session_info, ccb_project_id=ccb_pid, gemini_session_path=self._preferred_session_path
+                )
             )
         except Exception:
             pass
 
+        # (time.monotonic(), healthy, status) of the last terminal-probing health check.
+        self._health_cache: Optional[Tuple[float, bool, str]] = None
+
         # Lazy initialization: defer log reader and health check
         self._log_reader: Optional[GeminiLogReader] = None
         self._log_reader_primed = False
+        # Gemini session path last persisted to the project file; polls that see it again are no-ops.
+        self._last_remembered_session_path: Optional[str] = None
 
         if self.terminal == "wezterm" and self.backend and self.pane_title_marker:
             resolver = getattr(self.backend, "find_pane_by_title_marker", None)
@@ -585,12 +877,10 @@ class GeminiCommunicator:
         """Initialize log reader if not already done"""
         if self._log_reader is not None:
             return
-        work_dir_hint = self.session_info.get("work_dir")
-        log_work_dir = Path(work_dir_hint) if isinstance(work_dir_hint, str) and work_dir_hint else None
+        log_work_dir = Path(self._work_dir_hint) if self._work_dir_hint else None
         self._log_reader = GeminiLogReader(work_dir=log_work_dir)
-        preferred_session = self.session_info.get("gemini_session_path") or self.session_info.get("session_path")
-        if preferred_session:
-            self._log_reader.set_preferred_session(Path(str(preferred_session)))
+        if self._preferred_session_path:
+            self._log_reader.set_preferred_session(Path(str(self._preferred_session_path)))
         if not self._log_reader_primed:
             self._prime_log_binding()
             self._log_reader_primed = True
@@ -599,8 +889,8 @@ class GeminiCommunicator:
         env_session = (os.environ.get("CCB_SESSION_FILE") or "").strip()
         if env_session:
             try:
-                session_path = Path(os.path.expanduser(env_session))
-                if session_path.name == ".gemini-session" and session_path.is_file():
+                session_path = _env_gemini_session_path(env_session)
+                if session_path is not None and session_path.is_file():
                     return session_path
             except Exception:
                 pass
@@ -631,8 +921,7 @@ class GeminiCommunicator:
             session_file = self._find_session_file()
             if session_file:
                 try:
-                    with open(session_file, "r", encoding="utf-8") as f:
-                        file_data = json.load(f)
+                    file_data = _load_project_json(session_file)
                     if isinstance(file_data, dict):
                         result["gemini_session_path"] = file_data.get("gemini_session_path")
                         result["_session_file"] = str(session_file)
@@ -652,8 +941,7 @@ class GeminiCommunicator:
             return None
 
         try:
-            with open(project_session, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = _load_project_json(project_session)
 
             if not isinstance(data, dict) or not data.get("active", False):
                 return None
@@ -669,11 +957,21 @@ class GeminiCommunicator:
             return None
 
     def _check_session_health(self) -> Tuple[bool, str]:
-        return self._check_session_health_impl(probe_terminal=True)
+        # __init__ and ping()/get_status() probe back to back; reuse the result briefly so the
+        # terminal CLI (tmux/wezterm fork+exec) runs once.
+        now = time.monotonic()
+        cached = self._health_cache
+        if cached is not None and now - cached[0] < _HEALTH_CACHE_TTL_S:
+            return cached[1], cached[2]
+        healthy, status = self._check_session_health_impl(probe_terminal=True)
+        self._health_cache = (now, healthy, status)
+        return healthy, status
 
     def _check_session_health_impl(self, probe_terminal: bool) -> Tuple[bool, str]:
         try:
-            if not self.runtime_dir.exists():
+            try:
+                os.stat(self.runtime_dir)
+            except OSError:
                 return False, "Runtime directory not found"
             if not self.pane_id:
                 return False, "Session ID not found"
@@ -699,7 +997,11 @@ class GeminiCommunicator:
     def _send_via_terminal(self, content: str) -> bool:
         if not self.backend or not self.pane_id:
             raise RuntimeError("Terminal session not configured")
-        self.backend.send_text(self.pane_id, content)
+        try:
+            self.backend.send_text(self.pane_id, content)
+        except Exception:
+            self._health_cache = None
+            raise
         return True
 
     def _send_message(self, content: str) -> Tuple[str, Dict[str, Any]]:
@@ -709,7 +1011,7 @@ class GeminiCommunicator:
         return marker, state
 
     def _generate_marker(self) -> str:
-        return f"{self.marker_prefix}-{int(time.time())}-{os.getpid()}"
+        return f"{self.marker_prefix}-{time.time_ns() // 1_000_000_000}-{self._pid}"
 
     def ask_async(self, question: str) -> bool:
         try:
@@ -742,17 +1044,16 @@ class GeminiCommunicator:
                 start_time = time.time()
                 last_hint = 0
                 while True:
-                    message, new_state = self.log_reader.wait_for_message(state, timeout=30.0)
+                    message, new_state = self.log_reader.wait_for_message(state, timeout=float(self._progress_interval))
                     state = new_state if new_state else state
                     session_path = (new_state or {}).get("session_path") if isinstance(new_state, dict) else None
                     if isinstance(session_path, Path):
                         self._remember_gemini_session(session_path)
                     if message:
-                        print(f"🤖 {t('reply_from', provider='Gemini')}")
-                        print(message)
+                        print(f"🤖 {t('reply_from', provider='Gemini')}\n{message}")
                         return message
                     elapsed = int(time.time() - start_time)
-                    if elapsed >= last_hint + 30:
+                    if elapsed >= last_hint + self._progress_interval:
                         last_hint = elapsed
                         print(f"⏳ Still waiting... ({elapsed}s)")
 
@@ -762,8 +1063,7 @@ class GeminiCommunicator:
             if isinstance(session_path, Path):
                 self._remember_gemini_session(session_path)
             if message:
-                print(f"🤖 {t('reply_from', provider='Gemini')}")
-                print(message)
+                print(f"🤖 {t('reply_from', provider='Gemini')}\n{message}")
                 return message
 
             print(f"⏰ {t('timeout_no_reply', provider='Gemini')}")
@@ -784,12 +1084,15 @@ class GeminiCommunicator:
                     print(t('no_reply_available', provider='Gemini'))
                 return None
             if display:
+                # One write for the whole listing instead of up to three per turn.
+                lines: List[str] = []
                 for i, (question, reply) in enumerate(conversations):
                     if question:
-                        print(f"Q: {question}")
-                    print(f"A: {reply}")
+                        lines.append(f"Q: {question}")
+                    lines.append(f"A: {reply}")
                     if i < len(conversations) - 1:
-                        print("---")
+                        lines.append("---")
+                print("\n".join(lines))
             return conversations
 
         message = self.log_reader.latest_message()
@@ -802,20 +1105,19 @@ class GeminiCommunicator:
         return message
 
     def _remember_gemini_session(self, session_path: Path) -> None:
-        if not session_path or not self.project_session_file:
+        project_file = self._project_file_path
+        if not session_path or project_file is None:
             return
-        project_file = Path(self.project_session_file)
-        if not project_file.exists():
+        session_path_str = str(session_path)
+        if session_path_str == self._last_remembered_session_path:
             return
 
-        try:
-            with project_file.open("r", encoding="utf-8") as handle:
-                data = json.load(handle)
-        except Exception:
+        # A missing project file also comes back as None (one stat instead of exists() + stat).
+        data = _load_project_json(project_file)
+        if data is None:
             return
 
         updated = False
-        session_path_str = str(session_path)
         if data.get("gemini_session_path") != session_path_str:
             data["gemini_session_path"] = session_path_str
             updated = True
@@ -837,65 +1139,84 @@ class GeminiCommunicator:
             data["gemini_project_hash"] = project_hash
             updated = True
 
-        session_id = ""
-        try:
-            payload = json.loads(session_path.read_text(encoding="utf-8"))
-            if isinstance(payload, dict) and isinstance(payload.get("sessionId"), str):
-                session_id = payload["sessionId"]
-        except Exception:
-            session_id = ""
+        session_id = _read_session_id_from_head(session_path)
+        if not session_id:
+            try:
+                payload = json.loads(session_path.read_bytes())
+                if isinstance(payload, dict) and isinstance(payload.get("sessionId"), str):
+                    session_id = payload["sessionId"]
+            except Exception:
+                session_id = ""
         if session_id and data.get("gemini_session_id") != session_id:
             data["gemini_session_id"] = session_id
             updated = True
 
         if not updated:
+            self._last_remembered_session_path = session_path_str
             return
 
         tmp_file = project_file.with_suffix(".tmp")
         try:
-            with tmp_file.open("w", encoding="utf-8") as handle:
-                json.dump(data, handle, ensure_ascii=False, indent=2)
+            # Serialize up front and write once; json.dump() issues a write() per encoder chunk.
+            payload = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+            # Raw fd + binary handle: no text-IO layer around a single write.
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(payload)
             os.replace(tmp_file, project_file)
+            # The rewrite may keep the same size within one mtime tick; don't serve the old parse.
+            _forget_project_json(project_file)
+            self._last_remembered_session_path = session_path_str
         except PermissionError as e:
-            print(f"⚠️  Cannot update {project_file.name}: {e}", file=sys.stderr)
-            print(f"💡 Try: sudo chown $USER:$USER {project_file}", file=sys.stderr)
+            print(f"⚠️  Cannot update {project_file.name}: {e}\n💡 Try: sudo chown $USER:$USER {project_file}", file=sys.stderr)
             try:
-                if tmp_file.exists():
-                    tmp_file.unlink(missing_ok=True)
+                tmp_file.unlink(missing_ok=True)
             except Exception:
                 pass
         except Exception as e:
             print(f"⚠️  Failed to update {project_file.name}: {e}", file=sys.stderr)
             try:
-                if tmp_file.exists():
-                    tmp_file.unlink(missing_ok=True)
+                tmp_file.unlink(missing_ok=True)
             except Exception:
                 pass
 
         # Best-effort: keep registry in sync with the latest binding.
         try:
-            wd = data.get("work_dir")
             ccb_pid = str(data.get("ccb_project_id") or "").strip()
-            upsert_registry(
-                {
-                    "ccb_session_id": self.session_id,
-                    "ccb_project_id": ccb_pid or None,
-                    "work_dir": wd,
-                    "terminal": self.terminal,
-                    "providers": {
-                        "gemini": {
-                            "pane_id": self.pane_id or None,
-                            "pane_title_marker": data.get("pane_title_marker"),
-                            "session_file": str(project_file),
-                            "gemini_session_id": data.get("gemini_session_id"),
-                            "gemini_session_path": data.get("gemini_session_path"),
-                        }
-                    },
-                }
+            self._publish_registry(
+                self._build_registry_payload(data, ccb_project_id=ccb_pid, gemini_session_path=data.get("gemini_session_path"))
             )
         except Exception:
             pass
 
+    def _build_registry_payload(
+        self, session_data: Dict[str, Any], *, ccb_project_id: str, gemini_session_path: Any
+    ) -> Dict[str, Any]:
+        """Registry record for this communicator's Gemini binding, taking per-call fields from session_data."""
+        return {
+            "ccb_session_id": self.session_id,
+            "ccb_project_id": ccb_project_id or None,
+            "work_dir": session_data.get("work_dir"),
+            "terminal": self.terminal,
+            "providers": {
+                "gemini": {
+                    "pane_id": self.pane_id or None,
+                    "pane_title_marker": session_data.get("pane_title_marker"),
+                    "session_file": self.project_session_file,
+                    "gemini_session_id": session_data.get("gemini_session_id"),
+                    "gemini_session_path": gemini_session_path,
+                }
+            },
+        }
+
+    def _publish_registry(self, record: Dict[str, Any]) -> None:
+        """upsert_registry(), skipped when the record is identical to the last one published."""
+        key = json.dumps(record, sort_keys=True, ensure_ascii=False, default=str)
+        if key == self._last_registry_key:
+            return
+        if upsert_registry(record):
+            self._last_registry_key = key
+
     def ping(self, display: bool = True) -> Tuple[bool, str]:
         healthy, status = self._check_session_health()
         msg = f"✅ Gemini connection OK ({status})" if healthy else f"❌ Gemini connection error: {status}"
@@ -936,9 +1257,7 @@ def main() -> int:
             comm.ping()
         elif args.status:
             status = comm.get_status()
-            print("📊 Gemini status:")
-            for key, value in status.items():
-                print(f"   {key}: {value}")
+            print("\n".join(["📊 Gemini status:", *(f"   {key}: {value}" for key, value in status.items())]))
         elif args.pending is not None:
             comm.consume_pending(n=args.pending)
         elif args.question:
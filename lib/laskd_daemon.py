@@ -378,12 +378,6 @@ class LaskdServer:
         try:
             if isinstance(st, dict) and int(st.get("pid") or 0) == os.getpid():
                 self.state_file.unlink(missing_ok=True)
-        except TypeError:
-            try:
-                if isinstance(st, dict) and int(st.get("pid") or 0) == os.getpid() and self.state_file.exists():
-                    self.state_file.unlink()
-            except Exception:
-                pass
         except Exception:
             pass
 
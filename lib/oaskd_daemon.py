@@ -11,7 +11,7 @@ from typing import Optional
 from worker_pool import BaseSessionWorker, PerSessionWorkerPool
 
 from oaskd_protocol import OaskdRequest, OaskdResult, is_done_text, make_req_id, strip_done_text, wrap_opencode_prompt
-from oaskd_session import load_project_session
+from oaskd_session import find_project_session_file, load_project_session
 from opencode_comm import OpenCodeLogReader
 from process_lock import ProviderLock
 from terminal import get_backend_for_session
@@ -161,17 +161,24 @@ class _SessionWorker(BaseSessionWorker[_QueuedTask, OaskdResult]):
 
             pane_check_interval = float(os.environ.get("CCB_OASKD_PANE_CHECK_INTERVAL", "2.0") or "2.0")
             last_pane_check = time.time()
+            # wait_for_message polls storage itself; the slice only paces the pane/cancel checks
+            # below. Stretch it while OpenCode is quiet (up to the pane check interval) and
+            # tighten it again as soon as a reply chunk arrives.
+            min_wait_step = 0.5
+            max_wait_step = max(1.0, pane_check_interval)
+            wait_budget = min_wait_step
 
             while True:
+                now = time.time()
                 if deadline is not None:
-                    remaining = deadline - time.time()
+                    remaining = deadline - now
                     if remaining <= 0:
                         break
-                    wait_step = min(remaining, 1.0)
+                    wait_step = min(remaining, wait_budget)
                 else:
-                    wait_step = 1.0
+                    wait_step = wait_budget
 
-                if time.time() - last_pane_check >= pane_check_interval:
+                if now - last_pane_check >= pane_check_interval:
                     try:
                         alive = bool(backend.is_alive(pane_id))
                     except Exception:
@@ -235,7 +242,9 @@ class _SessionWorker(BaseSessionWorker[_QueuedTask, OaskdResult]):
                         pass
 
                 if not reply:
+                    wait_budget = min(wait_budget * 1.5, max_wait_step)
                     continue
+                wait_budget = min_wait_step
                 chunks.append(reply)
                 combined = "\n".join(chunks)
                 if is_done_text(combined, task.req_id):
@@ -272,12 +281,38 @@ class _SessionWorker(BaseSessionWorker[_QueuedTask, OaskdResult]):
 class _WorkerPool:
     def __init__(self):
         self._pool = PerSessionWorkerPool[_SessionWorker]()
+        # session file -> (st_mtime_ns, st_size, session_key); skips re-parsing it on every submit.
+        self._session_key_cache: dict[str, tuple[int, int, str]] = {}
 
     def submit(self, request: OaskdRequest) -> _QueuedTask:
         req_id = request.req_id or make_req_id()
         task = _QueuedTask(request=request, created_ms=_now_ms(), req_id=req_id, done_event=threading.Event())
 
-        session = load_project_session(Path(request.work_dir))
+        session_key = self._session_key_for(Path(request.work_dir))
+
+        worker = self._pool.get_or_create(session_key, _SessionWorker)
+        worker.enqueue(task)
+        try:
+            qsize = len(worker._q)
+        except Exception:
+            qsize = -1
+        write_log(log_path(OASKD_SPEC.log_file_name), f"[INFO] enqueued session={session_key} req_id={req_id} qsize={qsize} client_id={request.client_id}")
+        return task
+
+    def _session_key_for(self, work_dir: Path) -> str:
+        session_file = find_project_session_file(work_dir)
+        cache_key = str(session_file) if session_file else ""
+        if cache_key:
+            try:
+                st = os.stat(cache_key)
+            except OSError:
+                self._session_key_cache.pop(cache_key, None)
+            else:
+                cached = self._session_key_cache.get(cache_key)
+                if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                    return cached[2]
+
+        session = load_project_session(work_dir)
         ccb_project_id = ""
         try:
             if session:
@@ -289,19 +324,19 @@ class _WorkerPool:
                         session.data["ccb_project_id"] = ccb_project_id
                         session._write_back()
             else:
-                ccb_project_id = compute_ccb_project_id(Path(request.work_dir))
+                ccb_project_id = compute_ccb_project_id(work_dir)
         except Exception:
             ccb_project_id = ""
         session_key = f"opencode:{ccb_project_id}" if ccb_project_id else "opencode:unknown"
 
-        worker = self._pool.get_or_create(session_key, _SessionWorker)
-        worker.enqueue(task)
-        try:
-            qsize = int(worker._q.qsize())
-        except Exception:
-            qsize = -1
-        write_log(log_path(OASKD_SPEC.log_file_name), f"[INFO] enqueued session={session_key} req_id={req_id} qsize={qsize} client_id={request.client_id}")
-        return task
+        if session and cache_key:
+            # Stat after the optional write-back above so the migrated file is what gets keyed.
+            try:
+                st = os.stat(cache_key)
+                self._session_key_cache[cache_key] = (st.st_mtime_ns, st.st_size, session_key)
+            except OSError:
+                pass
+        return session_key
 
 
 class OaskdServer:
@@ -372,13 +407,7 @@ class OaskdServer:
             st = None
         try:
             if isinstance(st, dict) and int(st.get("pid") or 0) == os.getpid():
-                self.state_file.unlink(missing_ok=True)  # py3.8+: missing_ok
-        except TypeError:
-            try:
-                if isinstance(st, dict) and int(st.get("pid") or 0) == os.getpid() and self.state_file.exists():
-                    self.state_file.unlink()
-            except Exception:
-                pass
+                self.state_file.unlink(missing_ok=True)
         except Exception:
             pass
 
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import copy
 import json
 import os
 import sys
+import threading
 import time
 from pathlib import Path
-from typing import Optional, Dict, Any, Iterable
+from typing import Optional, Dict, Any, List, Tuple
 
 from cli_output import atomic_write_text
 from project_id import compute_ccb_project_id
@@ -34,11 +36,53 @@ def registry_path_for_session(session_id: str) -> Path:
     return _registry_dir() / f"{REGISTRY_PREFIX}{session_id}{REGISTRY_SUFFIX}"
 
 
-def _iter_registry_files() -> Iterable[Path]:
+# registry file path -> (st_mtime_ns, st_size, parsed record)
+_REGISTRY_ENTRY_CACHE: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+
+
+def _iter_registry_entries() -> List[Tuple[Path, Dict[str, Any]]]:
+    """
+    Return (path, record) for every registry file, sorted by file name.
+
+    Records are parsed once and reused until the file's mtime/size changes, so scans only
+    re-read files that changed. The returned dicts are shared cache objects: copy before mutating.
+    """
     registry_dir = _registry_dir()
-    if not registry_dir.exists():
+    try:
+        with os.scandir(registry_dir) as it:
+            entries = sorted(
+                (e for e in it if e.name.startswith(REGISTRY_PREFIX) and e.name.endswith(REGISTRY_SUFFIX)),
+                key=lambda e: e.name,
+            )
+    except OSError:
         return []
-    return sorted(registry_dir.glob(f"{REGISTRY_PREFIX}*{REGISTRY_SUFFIX}"))
+
+    results: List[Tuple[Path, Dict[str, Any]]] = []
+    seen: set[str] = set()
+    for entry in entries:
+        try:
+            st = entry.stat()
+        except OSError:
+            continue
+        key = entry.path
+        seen.add(key)
+        cached = _REGISTRY_ENTRY_CACHE.get(key)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            data = cached[2]
+        else:
+            loaded = _load_registry_file(Path(key))
+            if loaded is None:
+                _REGISTRY_ENTRY_CACHE.pop(key, None)
+                continue
+            data = loaded
+            _REGISTRY_ENTRY_CACHE[key] = (st.st_mtime_ns, st.st_size, data)
+        results.append((Path(key), data))
+
+    # Forget files that were removed from this registry dir.
+    prefix = os.path.join(str(registry_dir), "")
+    for key in [k for k in _REGISTRY_ENTRY_CACHE if k.startswith(prefix) and k not in seen]:
+        del _REGISTRY_ENTRY_CACHE[key]
+    return results
 
 
 def _coerce_updated_at(value: Any, fallback_path: Optional[Path] = None) -> int:
@@ -194,10 +238,7 @@ def load_registry_by_claude_pane(pane_id: str) -> Optional[Dict[str, Any]]:
         return None
     best: Optional[Dict[str, Any]] = None
     best_ts = -1
-    for path in _iter_registry_files():
-        data = _load_registry_file(path)
-        if not data:
-            continue
+    for path, data in _iter_registry_entries():
         providers = _get_providers_map(data)
         claude = providers.get("claude") if isinstance(providers, dict) else None
         claude_pane = (claude or {}).get("pane_id") if isinstance(claude, dict) else None
@@ -210,7 +251,7 @@ def load_registry_by_claude_pane(pane_id: str) -> Optional[Dict[str, Any]]:
         if updated_at > best_ts:
             best = data
             best_ts = updated_at
-    return best
+    return copy.deepcopy(best) if best else None
 
 
 def load_registry_by_project_id(ccb_project_id: str, provider: str) -> Optional[Dict[str, Any]]:
@@ -228,10 +269,7 @@ def load_registry_by_project_id(ccb_project_id: str, provider: str) -> Optional[
     best_ts = -1
     best_needs_migration = False
 
-    for path in _iter_registry_files():
-        data = _load_registry_file(path)
-        if not data:
-            continue
+    for path, data in _iter_registry_entries():
         updated_at = _coerce_updated_at(data.get("updated_at"), path)
         if _is_stale(updated_at):
             continue
@@ -260,6 +298,10 @@ def load_registry_by_project_id(ccb_project_id: str, provider: str) -> Optional[
             best_ts = updated_at
             best_needs_migration = (not existing) and bool(inferred)
 
+    if best:
+        # Detach the winner from the shared scan cache before handing it out (or migrating it).
+        best = copy.deepcopy(best)
+
     if best and best_needs_migration:
         # Best-effort persistence: update only the winning record to include ccb_project_id.
         try:
@@ -274,7 +316,17 @@ def load_registry_by_project_id(ccb_project_id: str, provider: str) -> Optional[
     return best
 
 
+# Serializes the read-merge-write below: askd hosts several provider workers in one process,
+# and two of them registering panes for the same session would otherwise drop each other's entry.
+_UPSERT_LOCK = threading.Lock()
+
+
 def upsert_registry(record: Dict[str, Any]) -> bool:
+    with _UPSERT_LOCK:
+        return _upsert_registry(record)
+
+
+def _upsert_registry(record: Dict[str, Any]) -> bool:
     session_id = record.get("ccb_session_id")
     if not session_id:
         _debug("Registry update skipped: missing ccb_session_id")
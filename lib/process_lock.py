@@ -149,10 +149,10 @@ class ProviderLock:
         self.lock_dir.mkdir(parents=True, exist_ok=True)
         self._fd = os.open(str(self.lock_file), os.O_CREAT | os.O_RDWR)
 
-        deadline = time.time() + self.timeout
+        deadline = time.monotonic() + self.timeout
         stale_checked = False
 
-        while time.time() < deadline:
+        while time.monotonic() < deadline:
             if self._try_acquire_once():
                 return True
 
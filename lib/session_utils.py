@@ -111,18 +111,16 @@ def safe_write_session(session_file: Path, content: str) -> Tuple[bool, Optional
             pass
         return True, None
     except PermissionError as e:
-        if tmp_file.exists():
-            try:
-                tmp_file.unlink()
-            except Exception:
-                pass
+        try:
+            tmp_file.unlink(missing_ok=True)
+        except Exception:
+            pass
         return False, f"❌ Cannot write {session_file.name}: {e}\n💡 Try: rm -f {session_file} then retry"
     except Exception as e:
-        if tmp_file.exists():
-            try:
-                tmp_file.unlink()
-            except Exception:
-                pass
+        try:
+            tmp_file.unlink(missing_ok=True)
+        except Exception:
+            pass
         return False, f"❌ Write failed: {e}"
 
 
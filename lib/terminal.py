@@ -234,6 +234,11 @@ class TmuxBackend(TerminalBackend):
         # Optional tmux server socket isolation (like `tmux -L <name>`). Useful for daemon mode.
         self._socket_name = (socket_name or os.environ.get("CCB_TMUX_SOCKET") or "").strip() or None
 
+    @property
+    def socket_name(self) -> str | None:
+        """tmux server socket (`-L`) this backend talks to; None for the default server."""
+        return self._socket_name
+
     def _tmux_base(self) -> list[str]:
         cmd = ["tmux"]
         if self._socket_name:
@@ -432,6 +437,26 @@ class TmuxBackend(TerminalBackend):
             return False
         return (cp.stdout or "").strip() == "0"
 
+    def list_pane_liveness(self) -> Optional[dict[str, bool]]:
+        """
+        Return {pane_id: alive} for every pane on the tmux server from a single tmux call.
+
+        Returns None when tmux could not be queried.
+        """
+        try:
+            cp = self._tmux_run(["list-panes", "-a", "-F", "#{pane_id}\t#{pane_dead}"], capture=True, timeout=1.0)
+        except Exception:
+            return None
+        if cp.returncode != 0:
+            return None
+        panes: dict[str, bool] = {}
+        for line in (cp.stdout or "").splitlines():
+            pid, _, dead = line.partition("\t")
+            pid = pid.strip()
+            if self._looks_like_pane_id(pid):
+                panes[pid] = dead.strip() == "0"
+        return panes
+
     def _ensure_not_in_copy_mode(self, pane_id: str) -> None:
         try:
             cp = self._tmux_run(["display-message", "-p", "-t", pane_id, "#{pane_in_mode}"], capture=True, timeout=1.0)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-import queue
 import threading
+from collections import deque
 from typing import Callable, Generic, Optional, Protocol, TypeVar
 
 
@@ -16,26 +16,38 @@ class QueuedTaskLike(Protocol[ResultT]):
 
 TaskT = TypeVar("TaskT", bound=QueuedTaskLike)
 
+_STOP = object()
+
 
 class BaseSessionWorker(threading.Thread, Generic[TaskT, ResultT]):
     def __init__(self, session_key: str):
         super().__init__(daemon=True)
         self.session_key = session_key
-        self._q: "queue.Queue[TaskT]" = queue.Queue()
-        self._stop_event = threading.Event()
+        # deque.append/popleft are atomic, so producers never contend on a queue mutex;
+        # _wakeup is only waited on when the deque has drained.
+        self._q: "deque[TaskT]" = deque()
+        self._wakeup = threading.Event()
 
     def enqueue(self, task: TaskT) -> None:
-        self._q.put(task)
+        self._q.append(task)
+        self._wakeup.set()
 
     def stop(self) -> None:
-        self._stop_event.set()
+        # Tasks queued before stop() still run; the sentinel ends the loop after them.
+        self._q.append(_STOP)  # type: ignore[arg-type]
+        self._wakeup.set()
 
     def run(self) -> None:
-        while not self._stop_event.is_set():
+        while True:
             try:
-                task = self._q.get(timeout=0.2)
-            except queue.Empty:
+                task = self._q.popleft()
+            except IndexError:
+                self._wakeup.wait()
+                # Re-check the deque after clearing so a concurrent enqueue is never lost.
+                self._wakeup.clear()
                 continue
+            if task is _STOP:
+                return
             try:
                 task.result = self._handle_task(task)
             except Exception as exc:
@@ -59,6 +71,11 @@ class PerSessionWorkerPool(Generic[WorkerT]):
         self._workers: dict[str, WorkerT] = {}
 
     def get_or_create(self, session_key: str, factory: Callable[[str], WorkerT]) -> WorkerT:
+        # Workers are never removed, so a hit on the plain dict read is final; only the first
+        # request for a session takes the lock.
+        worker = self._workers.get(session_key)
+        if worker is not None:
+            return worker
         created = False
         with self._lock:
             worker = self._workers.get(session_key)
@@ -1,11 +1,31 @@
 from __future__ import annotations
 
 import sys
+import types
 from pathlib import Path
 
+import pytest
+
 
 def pytest_configure() -> None:
     repo_root = Path(__file__).resolve().parents[1]
     lib_dir = repo_root / "lib"
     sys.path.insert(0, str(lib_dir))
 
+
+@pytest.fixture()
+def patch_module_global(monkeypatch: pytest.MonkeyPatch):
+    """
+    Swap a module-level import (e.g. gemini_comm.json) for a copy with some attributes
+    overridden, so the override never leaks into the real module other code shares.
+    """
+
+    def _patch(module: types.ModuleType, name: str, **overrides) -> types.ModuleType:
+        real = getattr(module, name)
+        proxy = types.ModuleType(real.__name__)
+        proxy.__dict__.update(real.__dict__)
+        proxy.__dict__.update(overrides)
+        monkeypatch.setattr(module, name, proxy)
+        return proxy
+
+    return _patch
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from askd.adapters.base import BaseProviderAdapter
+from askd.registry import ProviderRegistry
+
+
+class _Adapter(BaseProviderAdapter):
+    def __init__(self, key: str, events: list[str]):
+        self._key = key
+        self._events = events
+
+    @property
+    def key(self) -> str:
+        return self._key
+
+    @property
+    def spec(self):  # pragma: no cover - unused here
+        return None
+
+    @property
+    def session_filename(self) -> str:  # pragma: no cover - unused here
+        return ""
+
+    def load_session(self, work_dir):  # pragma: no cover - unused here
+        return None
+
+    def compute_session_key(self, session) -> str:  # pragma: no cover - unused here
+        return self._key
+
+    def handle_task(self, task):  # pragma: no cover - unused here
+        raise NotImplementedError
+
+    def on_start(self) -> None:
+        self._events.append(f"start:{self._key}")
+
+    def on_stop(self) -> None:
+        self._events.append(f"stop:{self._key}")
+
+
+def test_lazy_adapter_is_built_on_first_get_and_started() -> None:
+    events: list[str] = []
+    built: list[str] = []
+
+    def _factory() -> _Adapter:
+        built.append("gemini")
+        return _Adapter("gemini", events)
+
+    registry = ProviderRegistry()
+    registry.register_lazy("gemini", _factory)
+    registry.start_all()
+    assert registry.keys() == ["gemini"]
+    assert built == []
+
+    adapter = registry.get("gemini")
+    assert adapter is not None and adapter.key == "gemini"
+    assert registry.get("gemini") is adapter
+    assert built == ["gemini"]
+    assert events == ["start:gemini"]
+
+
+def test_stop_all_skips_and_blocks_adapters_never_built() -> None:
+    events: list[str] = []
+    registry = ProviderRegistry()
+    registry.register(_Adapter("codex", events))
+    registry.register_lazy("droid", lambda: _Adapter("droid", events))
+    registry.start_all()
+    registry.stop_all()
+    assert events == ["start:codex", "stop:codex"]
+
+    registry.warm_up()
+    assert registry.get("droid") is None
+    assert events == ["start:codex", "stop:codex"]
+
+
+def test_build_in_flight_at_stop_is_not_started_afterwards() -> None:
+    import threading
+
+    events: list[str] = []
+    entered = threading.Event()
+    release = threading.Event()
+
+    def _slow_factory() -> _Adapter:
+        entered.set()
+        release.wait(2.0)
+        return _Adapter("gemini", events)
+
+    registry = ProviderRegistry()
+    registry.register_lazy("gemini", _slow_factory)
+    registry.start_all()
+    warm = threading.Thread(target=registry.warm_up)
+    warm.start()
+    assert entered.wait(2.0)
+    stopper = threading.Thread(target=registry.stop_all)
+    stopper.start()
+    # Let stop_all() flag the shutdown (it then blocks on the in-flight build) before it finishes.
+    for _ in range(200):
+        if registry._stopped:
+            break
+        threading.Event().wait(0.01)
+    release.set()
+    warm.join(2.0)
+    stopper.join(2.0)
+    assert "start:gemini" not in events
+    assert registry.get("gemini") is None
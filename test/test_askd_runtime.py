@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import askd_runtime
+import gaskd_session
+
+
+def test_write_log_async_appends_in_order(tmp_path: Path) -> None:
+    log = tmp_path / "run" / "x.log"
+    for i in range(50):
+        askd_runtime.write_log_async(log, f"line {i}\n")
+    assert askd_runtime.flush_background_writes(timeout=2.0) is True
+    assert log.read_text(encoding="utf-8").splitlines() == [f"line {i}" for i in range(50)]
+
+
+def test_write_log_async_reopens_after_shrink(tmp_path: Path, monkeypatch) -> None:
+    log = tmp_path / "run" / "shrink.log"
+    monkeypatch.setenv("CCB_LOG_MAX_BYTES", "64")
+    monkeypatch.setenv("CCB_LOG_SHRINK_CHECK_INTERVAL_S", "0")
+    for i in range(20):
+        askd_runtime.write_log_async(log, f"entry-{i:02d}")
+        assert askd_runtime.flush_background_writes(timeout=2.0) is True
+
+    text = log.read_text(encoding="utf-8")
+    assert text.endswith("entry-19\n")
+    assert len(text.encode("utf-8")) <= 64 + len("entry-19\n")
+
+
+def test_write_session_async_keeps_latest_payload(tmp_path: Path) -> None:
+    session = tmp_path / ".gemini-session"
+    session.write_text("{}\n", encoding="utf-8")
+    for i in range(5):
+        askd_runtime.write_session_async(session, f'{{"n": {i}}}\n')
+    assert askd_runtime.flush_background_writes(timeout=2.0) is True
+    assert session.read_text(encoding="utf-8") == '{"n": 4}\n'
+
+
+def test_pending_session_write_is_visible_until_written(tmp_path: Path, monkeypatch) -> None:
+    # An unstarted writer keeps everything queued, so the read below races nothing.
+    writer = askd_runtime._BackgroundWriter()
+    monkeypatch.setattr(askd_runtime, "_WRITER", writer)
+    session = tmp_path / ".gemini-session"
+    session.write_text('{"pane_id": "%1"}\n', encoding="utf-8")
+
+    askd_runtime.write_session_async(session, '{"pane_id": "%2"}\n')
+    assert askd_runtime.pending_session_write(session) == '{"pane_id": "%2"}\n'
+    loaded = gaskd_session.load_project_session(tmp_path)
+    assert loaded is not None and loaded.pane_id == "%2"
+
+    writer._write_pending({}, {session: '{"pane_id": "%1"}\n'})
+    assert askd_runtime.pending_session_write(session) == '{"pane_id": "%2"}\n'
+    writer._write_pending({}, {session: writer.pending_session(session)})
+    assert askd_runtime.pending_session_write(session) is None
+    assert session.read_text(encoding="utf-8") == '{"pane_id": "%2"}\n'
+
+
+def test_run_dir_is_reused_until_env_changes(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("CCB_RUN_DIR", str(tmp_path / "a"))
+    first = askd_runtime.run_dir()
+    assert first == tmp_path / "a"
+    assert askd_runtime.run_dir() is first
+
+    monkeypatch.setenv("CCB_RUN_DIR", str(tmp_path / "b"))
+    assert askd_runtime.run_dir() == tmp_path / "b"
+    assert askd_runtime.log_path("gaskd") == tmp_path / "b" / "gaskd.log"
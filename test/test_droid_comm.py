@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+import droid_comm
+from droid_comm import DroidCommunicator
+
+
+def _write_session(path: Path, data: dict) -> None:
+    path.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+
+
+def test_load_session_info_reuses_cache_until_file_changes(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("CCB_SESSION_FILE", raising=False)
+    session_file = tmp_path / ".droid-session"
+    _write_session(session_file, {"session_id": "ai-1", "work_dir": str(tmp_path), "active": True})
+
+    comm = DroidCommunicator.__new__(DroidCommunicator)
+    first = comm._load_session_info()
+    assert first is not None
+    assert first["session_id"] == "ai-1"
+    assert first["_session_file"] == str(session_file)
+
+    # Mutating the returned dict must not leak into the cache.
+    first["session_id"] = "mutated"
+    assert comm._load_session_info()["session_id"] == "ai-1"
+    assert str(session_file) in droid_comm._SESSION_INFO_CACHE
+
+    _write_session(session_file, {"session_id": "ai-22", "work_dir": str(tmp_path), "active": True})
+    st = session_file.stat()
+    os.utime(session_file, (st.st_atime, st.st_mtime + 5))
+    assert comm._load_session_info()["session_id"] == "ai-22"
+
+    _write_session(session_file, {"session_id": "ai-22", "work_dir": str(tmp_path), "active": False})
+    os.utime(session_file, (st.st_atime, st.st_mtime + 10))
+    assert comm._load_session_info() is None
+
+
+def _write_log(path: Path, cwd: Path, lines: list[dict] | None = None) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    entries = [{"type": "session_start", "id": path.stem, "cwd": str(cwd)}] + list(lines or [])
+    path.write_text("".join(json.dumps(e) + "\n" for e in entries), encoding="utf-8")
+
+
+def test_scan_latest_session_prefers_newest_matching_work_dir(tmp_path: Path, monkeypatch) -> None:
+    root = tmp_path / "sessions"
+    work_dir = tmp_path / "repo"
+    other_dir = tmp_path / "other"
+    work_dir.mkdir()
+    other_dir.mkdir()
+
+    old = root / "slug" / "old.jsonl"
+    new = root / "slug" / "new.jsonl"
+    foreign = root / "slug" / "foreign.jsonl"
+    _write_log(old, work_dir)
+    _write_log(new, work_dir)
+    _write_log(foreign, other_dir)
+    os.utime(old, (100, 100))
+    os.utime(new, (200, 200))
+    os.utime(foreign, (300, 300))
+
+    reader = droid_comm.DroidLogReader(root=root, work_dir=work_dir)
+    assert reader._scan_latest_session() == new
+
+    monkeypatch.setattr(reader, "_scan_limit", 1)
+    assert reader._scan_latest_session() is None
+
+
+def test_latest_session_throttles_rescan_while_preferred_is_alive(tmp_path: Path, monkeypatch) -> None:
+    root = tmp_path / "sessions"
+    work_dir = tmp_path / "repo"
+    work_dir.mkdir()
+    first = root / "slug" / "first.jsonl"
+    _write_log(first, work_dir)
+    os.utime(first, (100, 100))
+
+    monkeypatch.setenv("DROID_SESSION_RESCAN_INTERVAL", "60")
+    reader = droid_comm.DroidLogReader(root=root, work_dir=work_dir)
+    reader.set_preferred_session(first)
+
+    calls: list[int] = []
+    real_scan = reader._scan_latest_session
+
+    def _counting_scan():
+        calls.append(1)
+        return real_scan()
+
+    monkeypatch.setattr(reader, "_scan_latest_session", _counting_scan)
+
+    assert reader._latest_session() == first
+    assert reader._latest_session() == first
+    assert len(calls) == 1
+
+    second = root / "slug" / "second.jsonl"
+    _write_log(second, work_dir)
+    os.utime(second, (200, 200))
+    assert reader._latest_session() == first
+
+    reader._last_full_scan = float("-inf")
+    assert reader._latest_session() == second
+    assert len(calls) == 2
+
+
+def test_read_droid_session_start_first_line_and_fallback(tmp_path: Path) -> None:
+    work_dir = tmp_path / "repo"
+    first = tmp_path / "first.jsonl"
+    _write_log(first, work_dir, [{"type": "message", "message": {"role": "user", "content": "q"}}])
+    assert droid_comm.read_droid_session_start(first) == (str(work_dir), "first")
+
+    late = tmp_path / "late.jsonl"
+    late.write_text(
+        "\n".join(
+            [
+                json.dumps({"type": "header", "pad": "x" * 5000}),
+                json.dumps({"type": "session_start", "id": "late", "cwd": str(work_dir)}),
+            ]
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+    assert droid_comm.read_droid_session_start(late) == (str(work_dir), "late")
+    assert droid_comm.read_droid_session_start(tmp_path / "missing.jsonl") == (None, None)
+
+
+@pytest.fixture()
+def bound_reader(tmp_path: Path) -> tuple[droid_comm.DroidLogReader, Path]:
+    """A reader bound to a fresh session log for tmp_path/repo."""
+    work_dir = tmp_path / "repo"
+    work_dir.mkdir()
+    log = tmp_path / "sessions" / "slug" / "s1.jsonl"
+    _write_log(log, work_dir)
+    reader = droid_comm.DroidLogReader(root=tmp_path / "sessions", work_dir=work_dir)
+    reader.set_preferred_session(log)
+    return reader, log
+
+
+def test_read_new_events_keeps_partial_line_in_carry(bound_reader: tuple[droid_comm.DroidLogReader, Path]) -> None:
+    reader, log = bound_reader
+    state = reader.capture_state()
+    assert isinstance(state["carry"], bytearray)
+
+    reply = json.dumps({"type": "message", "message": {"role": "assistant", "content": [{"type": "text", "text": "hi"}]}})
+    with log.open("ab") as handle:
+        handle.write(reply[:10].encode("utf-8"))
+    events, state = reader.try_get_events(state)
+    assert events == []
+    assert bytes(state["carry"]) == reply[:10].encode("utf-8")
+
+    with log.open("ab") as handle:
+        handle.write((reply[10:] + "\n").encode("utf-8"))
+    events, state = reader.try_get_events(state)
+    assert events == [("assistant", "hi")]
+    assert state["carry"] == bytearray()
+    assert state["offset"] == log.stat().st_size
+
+
+def test_read_new_messages_skips_lines_without_role_tags(
+    bound_reader: tuple[droid_comm.DroidLogReader, Path], patch_module_global
+) -> None:
+    reader, log = bound_reader
+    state = reader.capture_state()
+
+    with log.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps({"type": "tool_result", "content": "noise"}) + "\n")
+        handle.write(json.dumps({"type": "assistant", "content": "done"}) + "\n")
+
+    parsed: list[object] = []
+
+    def _tracking_loads(text, *args, **kwargs):
+        parsed.append(text)
+        return json.loads(text, *args, **kwargs)
+
+    patch_module_global(droid_comm, "json", loads=_tracking_loads)
+    message, _state = reader.try_get_message(state)
+    assert message == "done"
+    assert len(parsed) == 1
+
+
+def test_tail_readers_accept_capitalised_roles(bound_reader: tuple[droid_comm.DroidLogReader, Path]) -> None:
+    reader, log = bound_reader
+    state = reader.capture_state()
+
+    with log.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps({"type": "message", "message": {"role": "User", "content": "q"}}) + "\n")
+        handle.write(json.dumps({"type": "message", "message": {"role": "ASSISTANT", "content": "a"}}) + "\n")
+
+    events, _state = reader.try_get_events(state)
+    assert events == [("user", "q"), ("assistant", "a")]
+    message, _state = reader.try_get_message(state)
+    assert message == "a"
+    assert reader.latest_message() == "a"
+
+
+def test_extract_role_and_text_matches_per_role_extraction() -> None:
+    entries = [
+        {"type": "message", "message": {"role": "user", "content": "q"}},
+        {"type": "message", "message": {"role": "assistant", "content": [{"type": "thinking", "text": "x"}, {"type": "text", "text": "a"}]}},
+        {"type": "assistant", "content": "plain"},
+        {"role": "user", "message": "legacy"},
+        {"type": "tool_result", "content": "ignored"},
+        {"type": "message", "message": {"role": "assistant", "content": [{"type": "thinking", "text": "only"}]}},
+        {"type": "message", "role": "assistant", "message": {"role": "assistant", "content": ""}, "content": "outer"},
+        {"type": "message", "role": "user", "message": {"role": "assistant", "content": "a"}, "content": "outer"},
+        "not-a-dict",
+    ]
+    for entry in entries:
+        expected = None
+        for role in ("user", "assistant"):
+            text = droid_comm._extract_message(entry, role)
+            if text:
+                expected = (role, text)
+                break
+        assert droid_comm._extract_role_and_text(entry) == expected
+
+
+def test_extract_role_and_text_does_not_fall_back_past_empty_inner_message() -> None:
+    entry = {"type": "message", "role": "assistant", "message": {"role": "assistant", "content": ""}, "content": "outer"}
+    assert droid_comm._extract_message(entry, "assistant") is None
+    assert droid_comm._extract_role_and_text(entry) is None
@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import gaskd_daemon
+
+
+def _write_messages(path: Path, messages: list[dict]) -> None:
+    path.write_text(json.dumps({"sessionId": "s1", "messages": messages}), encoding="utf-8")
+
+
+def test_read_session_messages_reuses_cache_until_file_changes(tmp_path: Path, monkeypatch) -> None:
+    session = tmp_path / "session.json"
+    _write_messages(session, [{"type": "user", "content": "hi"}])
+
+    first = gaskd_daemon._read_session_messages(session)
+    assert first == [{"type": "user", "content": "hi"}]
+
+    calls: list[object] = []
+    real_loads = gaskd_daemon.json.loads
+
+    def _tracking_loads(raw, *args, **kwargs):
+        calls.append(raw)
+        return real_loads(raw, *args, **kwargs)
+
+    monkeypatch.setattr(gaskd_daemon.json, "loads", _tracking_loads)
+    assert gaskd_daemon._read_session_messages(session) is first
+    assert calls == []
+
+    _write_messages(session, [{"type": "user", "content": "hi"}, {"type": "gemini", "content": "yo"}])
+    st = session.stat()
+    os.utime(session, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert len(gaskd_daemon._read_session_messages(session) or []) == 2
+    assert len(calls) == 1
+
+    session.unlink()
+    assert gaskd_daemon._read_session_messages(session) is None
+
+
+def test_read_session_messages_concurrent_eviction(tmp_path: Path, monkeypatch) -> None:
+    import threading
+
+    monkeypatch.setattr(gaskd_daemon, "_SESSION_CACHE", {})
+    monkeypatch.setattr(gaskd_daemon, "_SESSION_CACHE_MAX", 4)
+    paths = []
+    for i in range(16):
+        path = tmp_path / f"session-{i}.json"
+        path.write_text(json.dumps({"messages": [{"type": "gemini", "content": str(i)}]}), encoding="utf-8")
+        paths.append(path)
+
+    errors: list[BaseException] = []
+    barrier = threading.Barrier(8)
+
+    def _reader(offset: int) -> None:
+        barrier.wait()
+        try:
+            for n in range(200):
+                path = paths[(offset + n) % len(paths)]
+                assert gaskd_daemon._read_session_messages(path)
+        except BaseException as exc:  # pragma: no cover - surfaced below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=_reader, args=(k,)) for k in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(10.0)
+    assert errors == []
+    assert len(gaskd_daemon._SESSION_CACHE) <= 4
+
+
+def test_detect_request_cancelled_matches_nearest_user_prompt(tmp_path: Path) -> None:
+    session = tmp_path / "session.json"
+    _write_messages(
+        session,
+        [
+            {"type": "user", "content": "CCB_REQ_ID: other\n\nhello"},
+            {"type": "info", "content": "Request cancelled."},
+            {"type": "user", "content": "CCB_REQ_ID: mine\n\nhello"},
+            {"type": "gemini", "content": "working"},
+            {"type": "info", "content": "Request canceled."},
+        ],
+    )
+    assert gaskd_daemon._detect_request_cancelled(session, from_index=0, req_id="mine") is True
+    assert gaskd_daemon._detect_request_cancelled(session, from_index=0, req_id="other") is True
+    assert gaskd_daemon._detect_request_cancelled(session, from_index=2, req_id="other") is False
+    assert gaskd_daemon._detect_request_cancelled(session, from_index=5, req_id="mine") is False
+
+
+def test_detect_request_cancelled_resolves_owner_before_from_index(tmp_path: Path) -> None:
+    session = tmp_path / "session.json"
+    _write_messages(
+        session,
+        [
+            {"type": "user", "content": "CCB_REQ_ID: mine\n\nhello"},
+            {"type": "info", "content": "Request cancelled."},
+        ],
+    )
+    assert gaskd_daemon._detect_request_cancelled(session, from_index=1, req_id="mine") is True
+    assert gaskd_daemon._detect_request_cancelled(session, from_index=1, req_id="other") is False
+
+
+def test_is_cancel_text_variants() -> None:
+    assert gaskd_daemon._is_cancel_text("Request cancelled.") is True
+    assert gaskd_daemon._is_cancel_text("  REQUEST CANCELED by user") is True
+    assert gaskd_daemon._is_cancel_text("request was cancelled") is False
+    assert gaskd_daemon._is_cancel_text("") is False
+
+
+def test_worker_pool_caches_session_key_by_session_file_stat(tmp_path: Path, monkeypatch) -> None:
+    session_file = tmp_path / ".gemini-session"
+    session_file.write_text(
+        json.dumps({"ccb_project_id": "p1", "work_dir": str(tmp_path), "active": True}), encoding="utf-8"
+    )
+
+    loads: list[Path] = []
+    real_load = gaskd_daemon.load_project_session
+
+    def _tracking_load(work_dir: Path):
+        loads.append(work_dir)
+        return real_load(work_dir)
+
+    monkeypatch.setattr(gaskd_daemon, "load_project_session", _tracking_load)
+    pool = gaskd_daemon._WorkerPool()
+    assert pool._session_key_for(tmp_path) == "gemini:p1"
+    assert pool._session_key_for(tmp_path) == "gemini:p1"
+    assert len(loads) == 1
+
+    session_file.write_text(
+        json.dumps({"ccb_project_id": "p22", "work_dir": str(tmp_path), "active": True}), encoding="utf-8"
+    )
+    st = session_file.stat()
+    os.utime(session_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert pool._session_key_for(tmp_path) == "gemini:p22"
+    assert len(loads) == 2
+
+    session_file.unlink()
+    assert pool._session_key_for(tmp_path) == "gemini:unknown"
+
+
+def test_pane_liveness_cache_shares_one_snapshot_across_backend_instances(monkeypatch) -> None:
+    import subprocess
+
+    from terminal import TmuxBackend
+
+    calls: list[list[str]] = []
+
+    def fake_run(self, args, **_kwargs):
+        calls.append([*self._tmux_base(), *args])
+        return subprocess.CompletedProcess(args, 0, stdout="%1\t0\n%2\t1\n", stderr="")
+
+    monkeypatch.setattr(TmuxBackend, "_tmux_run", fake_run)
+    monkeypatch.delenv("CCB_TMUX_SOCKET", raising=False)
+    monkeypatch.delenv("CCB_GASKD_PANE_CHECK_INTERVAL", raising=False)
+
+    cache = gaskd_daemon._PaneLivenessCache()
+    # get_backend_for_session() returns a new TmuxBackend per request.
+    assert cache.is_alive(TmuxBackend(), "%1") is True
+    assert cache.is_alive(TmuxBackend(), "%2") is False
+    assert cache.is_alive(TmuxBackend(), "%9") is False
+    assert len(calls) == 1
+
+    # A different tmux server gets its own snapshot.
+    assert cache.is_alive(TmuxBackend(socket_name="other"), "%1") is True
+    assert len(calls) == 2
+    assert calls[1][:3] == ["tmux", "-L", "other"]
+
+
+def test_pane_liveness_cache_ttl_covers_pane_check_interval(monkeypatch) -> None:
+    monkeypatch.setenv("CCB_GASKD_PANE_CHECK_INTERVAL", "5")
+    assert gaskd_daemon._PaneLivenessCache()._max_age_s >= gaskd_daemon._pane_check_interval() == 5.0
+
+
+def test_pane_liveness_cache_falls_back_for_session_names() -> None:
+    class _Backend:
+        def __init__(self) -> None:
+            self.alive_calls = 0
+
+        def list_pane_liveness(self):
+            raise AssertionError("session-name targets must not use the snapshot")
+
+        def is_alive(self, pane_id: str) -> bool:
+            self.alive_calls += 1
+            return True
+
+    backend = _Backend()
+    cache = gaskd_daemon._PaneLivenessCache(max_age_s=60.0)
+    assert cache.is_alive(backend, "ccb-session") is True
+    assert backend.alive_calls == 1
+
+
+def _dedup_pool(monkeypatch, enabled: bool) -> tuple[gaskd_daemon._WorkerPool, list]:
+    if enabled:
+        monkeypatch.setenv("CCB_GASKD_DEDUP", "1")
+    else:
+        monkeypatch.delenv("CCB_GASKD_DEDUP", raising=False)
+    pool = gaskd_daemon._WorkerPool()
+    enqueued: list = []
+
+    class _FakeWorker:
+        def enqueue(self, task) -> None:
+            enqueued.append(task)
+
+    monkeypatch.setattr(pool, "_session_key_for", lambda _work_dir: "gemini:test")
+    monkeypatch.setattr(pool._pool, "get_or_create", lambda _key, _factory: _FakeWorker())
+    return pool, enqueued
+
+
+def _gask_request(message: str, req_id: str | None = None, **overrides) -> gaskd_daemon.GaskdRequest:
+    fields = {"client_id": "c", "work_dir": "/tmp", "timeout_s": 1.0, "quiet": True, "message": message, "req_id": req_id}
+    fields.update(overrides)
+    return gaskd_daemon.GaskdRequest(**fields)
+
+
+def test_worker_pool_dedup_shares_inflight_task(monkeypatch) -> None:
+    pool, enqueued = _dedup_pool(monkeypatch, enabled=True)
+    first = pool.submit(_gask_request("same"))
+    assert pool.submit(_gask_request("same")) is first
+    assert pool.submit(_gask_request("other")) is not first
+    assert pool.submit(_gask_request("same", req_id="pinned")) is not first
+    assert len(enqueued) == 3
+
+    first.done_event.set()
+    assert pool.submit(_gask_request("same")) is not first
+
+
+def test_worker_pool_dedup_keeps_requests_with_different_options_apart(monkeypatch) -> None:
+    pool, enqueued = _dedup_pool(monkeypatch, enabled=True)
+    first = pool.submit(_gask_request("same"))
+    assert pool.submit(_gask_request("same", client_id="other-client")) is first
+    assert pool.submit(_gask_request("same", timeout_s=5.0)) is not first
+    assert pool.submit(_gask_request("same", quiet=False)) is not first
+    assert pool.submit(_gask_request("same", output_path="/tmp/out.txt")) is not first
+    assert pool.submit(_gask_request("same", caller="codex")) is not first
+    assert len(enqueued) == 5
+
+
+def test_worker_pool_dedup_is_opt_in(monkeypatch) -> None:
+    pool, enqueued = _dedup_pool(monkeypatch, enabled=False)
+    assert pool.submit(_gask_request("same")) is not pool.submit(_gask_request("same"))
+    assert len(enqueued) == 2
+
+
+def test_registry_upsert_skips_identical_record_within_window(monkeypatch) -> None:
+    calls: list[dict] = []
+    monkeypatch.setattr(gaskd_daemon, "upsert_registry", lambda record: calls.append(record) or True)
+    monkeypatch.setattr(gaskd_daemon, "_REGISTRY_UPSERTS", {})
+
+    record = {"ccb_session_id": "s1", "providers": {"gemini": {"pane_id": "%1"}}}
+    assert gaskd_daemon._upsert_registry_coalesced(record)
+    assert gaskd_daemon._upsert_registry_coalesced(dict(record))
+    assert len(calls) == 1
+
+    changed = {"ccb_session_id": "s1", "providers": {"gemini": {"pane_id": "%2"}}}
+    assert gaskd_daemon._upsert_registry_coalesced(changed)
+    assert len(calls) == 2
+
+    monkeypatch.setattr(gaskd_daemon, "_REGISTRY_UPSERT_WINDOW_S", 0.0)
+    assert gaskd_daemon._upsert_registry_coalesced(changed)
+    assert len(calls) == 3
@@ -125,3 +125,35 @@ def test_gaskd_ensure_pane_marker_rediscover(tmp_path: Path, monkeypatch: pytest
 
     data = json.loads(session_path.read_text(encoding="utf-8"))
     assert data["pane_id"] == "%2"
+
+
+def test_gaskd_ensure_pane_reuses_recent_liveness(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Back-to-back ensure_pane calls should not re-query the backend within the TTL."""
+    session_path = tmp_path / ".gemini-session"
+    session_path.write_text(
+        json.dumps({"terminal": "tmux", "pane_id": "%1", "work_dir": str(tmp_path), "active": True}),
+        encoding="utf-8",
+    )
+
+    backend = FakeTmuxBackend()
+    backend.alive = {"%1": True}
+    calls: list[str] = []
+    real_is_alive = backend.is_alive
+
+    def counting_is_alive(pane_id: str) -> bool:
+        calls.append(pane_id)
+        return real_is_alive(pane_id)
+
+    backend.is_alive = counting_is_alive  # type: ignore[method-assign]
+    monkeypatch.setattr(gaskd_session, "get_backend_for_session", lambda data: backend)
+
+    sess = gaskd_session.load_project_session(tmp_path)
+    assert sess is not None
+    assert sess.ensure_pane() == (True, "%1")
+    assert sess.ensure_pane() == (True, "%1")
+    assert calls == ["%1"]
+
+    sess.forget_pane_alive()
+    backend.alive["%1"] = False
+    ok, _ = sess.ensure_pane()
+    assert ok is False
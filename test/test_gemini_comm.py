@@ -0,0 +1,527 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+import gemini_comm
+from gemini_comm import GeminiCommunicator, GeminiLogReader
+
+
+class _FakeClock:
+    """Stands in for gemini_comm.time: sleep() advances monotonic() instead of blocking."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture()
+def clock(patch_module_global) -> _FakeClock:
+    fake = _FakeClock()
+    patch_module_global(gemini_comm, "time", monotonic=fake.monotonic, sleep=fake.sleep)
+    return fake
+
+
+@pytest.fixture()
+def reader(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> GeminiLogReader:
+    monkeypatch.delenv("GEMINI_PROJECT_HASH", raising=False)
+    monkeypatch.delenv("GEMINI_IDLE_POLL_MAX", raising=False)
+    monkeypatch.setenv("GEMINI_POLL_INTERVAL", "0.05")
+    monkeypatch.setenv("GEMINI_FORCE_READ_INTERVAL", "5")
+    work_dir = tmp_path / "proj"
+    work_dir.mkdir()
+    return GeminiLogReader(root=tmp_path / "gemini", work_dir=work_dir)
+
+
+@pytest.fixture()
+def chats(reader: GeminiLogReader) -> Path:
+    path = reader.root / reader._project_hash / "chats"
+    path.mkdir(parents=True)
+    return path
+
+
+@pytest.fixture()
+def session_reads(reader: GeminiLogReader, monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+    """Records every full JSON parse of the session file done by `reader`."""
+    reads: list[Path] = []
+    real_read = reader._read_session_json
+
+    def counting_read(path: Path, stat=None):
+        reads.append(path)
+        return real_read(path, stat)
+
+    monkeypatch.setattr(reader, "_read_session_json", counting_read)
+    return reads
+
+
+def _write_session(path: Path, messages: list[dict]) -> None:
+    path.write_text(json.dumps({"sessionId": "s1", "messages": messages}), encoding="utf-8")
+
+
+def _forbid_full_parse(reader: GeminiLogReader, monkeypatch: pytest.MonkeyPatch) -> None:
+    def no_full_parse(*args, **kwargs):
+        raise AssertionError("large session should be read from the tail")
+
+    monkeypatch.setattr(reader, "_read_session_json", no_full_parse)
+
+
+# --- wait_for_message: idle backoff and change detection ---
+
+
+def test_read_since_backs_off_while_session_is_unchanged(reader: GeminiLogReader, chats: Path, clock: _FakeClock) -> None:
+    _write_session(chats / "session-1.json", [{"type": "user", "content": "hi"}])
+    state = reader.capture_state()
+
+    reply, _state = reader.wait_for_message(state, 0.8)
+
+    assert reply is None
+    assert clock.sleeps[0] == 0.05
+    assert max(clock.sleeps) <= reader._idle_poll_max
+    assert any(s > 0.05 for s in clock.sleeps)
+    assert len(clock.sleeps) < 0.8 / 0.05
+
+
+def test_idle_backoff_carries_across_wait_slices(reader: GeminiLogReader, chats: Path, clock: _FakeClock) -> None:
+    _write_session(chats / "session-1.json", [{"type": "user", "content": "hi"}])
+    state = reader.capture_state()
+    reader.wait_for_message(state, 0.5)
+    assert reader._idle_sleep > reader._poll_interval
+
+    clock.sleeps.clear()
+    reader.wait_for_message(state, 0.3)
+    assert clock.sleeps[0] > reader._poll_interval
+
+    reader.capture_state()
+    assert reader._idle_sleep == reader._poll_interval
+
+
+def test_idle_wait_returns_caller_state_when_nothing_changed(reader: GeminiLogReader, chats: Path, clock: _FakeClock) -> None:
+    _write_session(chats / "session-1.json", [{"type": "user", "content": "hi"}])
+    state = reader.capture_state()
+
+    reply, new_state = reader.wait_for_message(state, 0.1)
+    assert reply is None
+    assert new_state is state
+
+    _write_session(chats / "session-1.json", [{"type": "user", "content": "hi"}, {"type": "gemini", "content": "yo"}])
+    reply, new_state = reader.wait_for_message(state, 0.5)
+    assert reply == "yo"
+    assert new_state is not state
+    assert new_state["msg_count"] == 2
+
+
+def test_read_since_skips_json_parse_when_session_unchanged(
+    reader: GeminiLogReader, chats: Path, clock: _FakeClock, session_reads: list[Path]
+) -> None:
+    session = chats / "session-1.json"
+    _write_session(session, [{"type": "user", "content": "hi"}])
+    state = reader.capture_state()
+    session_reads.clear()
+
+    reply, state = reader.wait_for_message(state, 0.3)
+    assert reply is None
+    assert session_reads == []
+
+    _write_session(session, [{"type": "user", "content": "hi"}, {"type": "gemini", "content": "hello"}])
+    reply, _state = reader.wait_for_message(state, 1.0)
+    assert reply == "hello"
+    assert session_reads
+
+
+def test_read_since_skips_parse_when_only_head_changes(
+    reader: GeminiLogReader, chats: Path, clock: _FakeClock, session_reads: list[Path]
+) -> None:
+    session = chats / "session-1.json"
+
+    def write(updated: str, reply: str, mtime_ns: int) -> None:
+        session.write_text(
+            json.dumps({"lastUpdated": updated, "messages": [{"type": "user", "content": "x" * 8192}, {"id": "g", "type": "gemini", "content": reply}]}),
+            encoding="utf-8",
+        )
+        os.utime(session, ns=(0, mtime_ns))
+
+    write("2026-01-01T00:00:00", "aaaa", 1_000_000_000)
+    state = reader.capture_state()
+    session_reads.clear()
+
+    # Same size, only the head timestamp moved: the first change is parsed to learn the tail ...
+    write("2026-01-01T00:00:01", "aaaa", 2_000_000_000)
+    reply, state = reader.wait_for_message(state, 0.2)
+    assert reply is None and len(session_reads) == 1
+
+    # ... later head-only rewrites are skipped without parsing.
+    write("2026-01-01T00:00:02", "aaaa", 3_000_000_000)
+    reply, state = reader.wait_for_message(state, 0.2)
+    assert reply is None and len(session_reads) == 1
+
+    # A same-size change in the reply itself is still picked up.
+    write("2026-01-01T00:00:03", "bbbb", 4_000_000_000)
+    reply, _state = reader.wait_for_message(state, 0.5)
+    assert reply == "bbbb"
+
+
+def test_read_since_reports_in_place_reply_update_once(reader: GeminiLogReader, chats: Path, clock: _FakeClock) -> None:
+    session = chats / "session-1.json"
+    _write_session(session, [{"type": "user", "content": "hi"}, {"id": "g1", "type": "gemini", "content": ""}])
+    state = reader.capture_state()
+
+    _write_session(session, [{"type": "user", "content": "hi"}, {"id": "g1", "type": "gemini", "content": "par"}])
+    reply, state = reader.wait_for_message(state, 1.0)
+    assert reply == "par"
+
+    _write_session(session, [{"type": "user", "content": "hi"}, {"id": "g1", "type": "gemini", "content": "partial"}])
+    reply, state = reader.wait_for_message(state, 1.0)
+    assert reply == "partial"
+
+    st = session.stat()
+    os.utime(session, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    reply, _state = reader.wait_for_message(state, 0.3)
+    assert reply is None
+
+
+def test_read_since_lists_chats_dir_only_on_rescan(
+    reader: GeminiLogReader, chats: Path, clock: _FakeClock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _write_session(chats / "session-1.json", [{"type": "user", "content": "hi"}])
+    state = reader.capture_state()
+
+    scans: list[str] = []
+    real_latest_in = GeminiLogReader._latest_in_chats_dir
+
+    def counting_latest_in(chats_dir: str):
+        scans.append(chats_dir)
+        return real_latest_in(chats_dir)
+
+    monkeypatch.setattr(GeminiLogReader, "_latest_in_chats_dir", staticmethod(counting_latest_in))
+    reply, _state = reader.wait_for_message(state, 0.5)
+    assert reply is None
+    # One initial resolve plus one rescan (rescan interval is 0.25s for a 0.5s wait).
+    assert len(scans) == 2
+
+
+# --- reading the session JSON ---
+
+
+def test_read_session_json_retries_torn_utf8_write(reader: GeminiLogReader, chats: Path, patch_module_global) -> None:
+    session = chats / "session-1.json"
+    full = json.dumps({"messages": [{"type": "gemini", "content": "héllo"}]}, ensure_ascii=False).encode("utf-8")
+    session.write_bytes(full[: full.index("é".encode("utf-8")) + 1])
+
+    def finish_write(seconds: float) -> None:
+        session.write_bytes(full)
+
+    patch_module_global(gemini_comm, "time", sleep=finish_write)
+    data = reader._read_session_json(session)
+    assert data == {"messages": [{"type": "gemini", "content": "héllo"}]}
+
+
+def test_load_json_file_retries_without_sleep_when_file_changed(tmp_path: Path, patch_module_global) -> None:
+    path = tmp_path / "session.json"
+    path.write_bytes(b'{"messages": [')
+    stale = os.stat(path)
+    path.write_bytes(b'{"messages": []}')
+    os.utime(path, ns=(stale.st_atime_ns, stale.st_mtime_ns + 1_000_000))
+
+    def no_sleep(seconds: float) -> None:
+        raise AssertionError("changed file should be re-read without sleeping")
+
+    # Simulates a parse that failed against the stale stat: the file has moved on since.
+    calls = []
+
+    def flaky_loads(raw):
+        calls.append(raw)
+        if len(calls) == 1:
+            raise ValueError("torn")
+        return json.loads(raw)
+
+    patch_module_global(gemini_comm, "time", sleep=no_sleep)
+    patch_module_global(gemini_comm, "json", loads=flaky_loads)
+    assert gemini_comm.load_json_file(path, stale) == {"messages": []}
+    assert len(calls) == 2
+
+
+def test_load_json_file_gives_up_after_bounded_backoff(tmp_path: Path, patch_module_global) -> None:
+    path = tmp_path / "session.json"
+    path.write_bytes(b'{"messages": [')
+    sleeps: list[float] = []
+    patch_module_global(gemini_comm, "time", sleep=sleeps.append)
+    assert gemini_comm.load_json_file(path) is None
+    assert sleeps == [0.005, 0.01, 0.02, 0.04]
+
+
+def test_read_session_id_from_head_stops_at_messages(tmp_path: Path) -> None:
+    session = tmp_path / "session-1.json"
+    session.write_text(
+        json.dumps({"sessionId": "abc-123", "projectHash": "h", "messages": [{"type": "user", "content": "x" * 10000}]}),
+        encoding="utf-8",
+    )
+    assert gemini_comm._read_session_id_from_head(session) == "abc-123"
+
+    # A sessionId that only shows up inside messages must not be picked up from the head.
+    session.write_text(json.dumps({"messages": [{"sessionId": "inner"}], "sessionId": "outer"}), encoding="utf-8")
+    assert gemini_comm._read_session_id_from_head(session) == ""
+    assert gemini_comm._read_session_id_from_head(tmp_path / "missing.json") == ""
+
+
+# --- locating the session file ---
+
+
+def test_scan_latest_session_picks_newest_session_file(reader: GeminiLogReader, chats: Path) -> None:
+    older = chats / "session-a.json"
+    newer = chats / "session-b.json"
+    _write_session(older, [])
+    _write_session(newer, [])
+    (chats / "notes.json").write_text("{}", encoding="utf-8")
+    (chats / "session-dir.json").mkdir()
+    os.utime(older, (1_000_000, 2_000_000))
+    os.utime(newer, (1_000_000, 1_000_000))
+    assert reader._scan_latest_session() == older
+
+    os.utime(newer, (1_000_000, 3_000_000))
+    assert reader._scan_latest_session() == newer
+    assert reader._scan_latest_session_any_project() == newer
+
+
+def test_chats_dir_is_cached_until_scan_finds_nothing(
+    reader: GeminiLogReader, chats: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    session = chats / "session-1.json"
+    _write_session(session, [])
+    assert reader._scan_latest_session() == session
+    assert reader._chats_dir_cache is not None
+
+    calls: list[Path] = []
+    real_is_dir = Path.is_dir
+
+    def counting_is_dir(self: Path) -> bool:
+        calls.append(self)
+        return real_is_dir(self)
+
+    monkeypatch.setattr(Path, "is_dir", counting_is_dir)
+    assert reader._scan_latest_session() == session
+    assert calls == []
+
+    session.unlink()
+    assert reader._scan_latest_session() is None
+    assert reader._chats_dir_cache is None
+
+
+def test_scan_latest_session_reuses_bound_path_object(reader: GeminiLogReader, chats: Path) -> None:
+    _write_session(chats / "session-1.json", [])
+    first = reader._latest_session()
+    assert first == chats / "session-1.json"
+    assert reader._scan_latest_session() is first
+
+
+# --- latest_message ---
+
+
+def test_latest_message_tolerates_odd_entries(reader: GeminiLogReader, chats: Path) -> None:
+    assert reader.latest_message() is None
+    _write_session(
+        chats / "session-1.json",
+        [{"type": "gemini", "content": " first "}, "noise", {"type": "gemini", "content": 42}, {"type": "user", "content": "q"}],
+    )
+    assert reader.latest_message() == "42"
+
+
+def test_latest_message_reads_large_session_from_tail(
+    reader: GeminiLogReader, chats: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    session = chats / "session-1.json"
+    messages = [
+        {"id": "u1", "type": "user", "content": "x" * (300 * 1024)},
+        {"id": "g1", "type": "gemini", "content": "old"},
+        {"id": "u2", "type": "user", "content": 'say \\"type\\": \\"gemini\\" {'},
+        {
+            "id": "g2",
+            "content": ' {braces} "quoted" }',
+            "thoughts": [{"subject": "s", "description": "{"}],
+            "type": "gemini",
+            "tokens": {"input": 1},
+        },
+        {"id": "u3", "type": "user", "content": "follow-up"},
+    ]
+    _write_session(session, messages)
+    assert session.stat().st_size > gemini_comm._TAIL_PARSE_MIN_BYTES
+
+    _forbid_full_parse(reader, monkeypatch)
+    assert reader.latest_message() == '{braces} "quoted" }'
+
+
+def test_latest_message_tail_scan_survives_truncation(
+    reader: GeminiLogReader, chats: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    session = chats / "session-1.json"
+    _write_session(
+        session,
+        [{"id": "u1", "type": "user", "content": "x" * (300 * 1024)}, {"id": "g1", "type": "gemini", "content": "done"}],
+    )
+    real_marker = gemini_comm._last_gemini_type_marker
+    truncated: list[int] = []
+
+    def truncate_then_scan(buf):
+        # Gemini CLI rewriting the file mid-scan: the bytes already read must stay valid.
+        if not truncated:
+            with open(session, "r+b") as handle:
+                handle.truncate(0)
+            truncated.append(1)
+        return real_marker(buf)
+
+    monkeypatch.setattr(gemini_comm, "_last_gemini_type_marker", truncate_then_scan)
+    assert reader.latest_message() == "done"
+    assert truncated == [1]
+    assert session.stat().st_size == 0
+
+
+def test_latest_message_tail_window_grows_for_long_reply(
+    reader: GeminiLogReader, chats: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    session = chats / "session-1.json"
+    long_reply = "y" * (600 * 1024)
+    _write_session(
+        session,
+        [{"id": "u1", "type": "user", "content": "q"}, {"id": "g1", "type": "gemini", "content": long_reply}],
+    )
+
+    _forbid_full_parse(reader, monkeypatch)
+    assert reader.latest_message() == long_reply
+
+
+# --- GeminiCommunicator: project file and registry bookkeeping ---
+
+
+@pytest.fixture()
+def project_file(tmp_path: Path) -> Path:
+    path = tmp_path / ".gemini-session"
+    path.write_text(json.dumps({"active": True, "work_dir": str(tmp_path), "ccb_project_id": "p1"}), encoding="utf-8")
+    return path
+
+
+@pytest.fixture()
+def upserts(monkeypatch: pytest.MonkeyPatch) -> list[dict]:
+    records: list[dict] = []
+    monkeypatch.setattr(gemini_comm, "upsert_registry", lambda record: records.append(record) or True)
+    return records
+
+
+@pytest.fixture()
+def comm(tmp_path: Path, project_file: Path, upserts: list[dict], monkeypatch: pytest.MonkeyPatch) -> GeminiCommunicator:
+    session_info = {
+        "session_id": "ccb-1",
+        "runtime_dir": str(tmp_path),
+        "terminal": "tmux",
+        "pane_id": "%1",
+        "work_dir": str(tmp_path),
+        "_session_file": str(project_file),
+    }
+    monkeypatch.setattr(GeminiCommunicator, "_load_session_info", lambda self: dict(session_info))
+    monkeypatch.setattr(gemini_comm, "get_backend_for_session", lambda _info: None)
+    communicator = GeminiCommunicator(lazy_init=True)
+    # Drop the registry record published by __init__; tests count their own upserts.
+    upserts.clear()
+    return communicator
+
+
+def test_load_project_json_reuses_parse_until_file_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, patch_module_global
+) -> None:
+    monkeypatch.setattr(gemini_comm, "_PROJECT_JSON_CACHE", {})
+    path = tmp_path / ".gemini-session"
+    path.write_text(json.dumps({"active": True, "pane_id": "%1"}), encoding="utf-8")
+
+    first = gemini_comm._load_project_json(path)
+    assert first == {"active": True, "pane_id": "%1"}
+    first["pane_id"] = "mutated"
+
+    parses: list[bytes] = []
+
+    def counting_loads(raw):
+        parses.append(raw)
+        return json.loads(raw)
+
+    patch_module_global(gemini_comm, "json", loads=counting_loads)
+    assert gemini_comm._load_project_json(path) == {"active": True, "pane_id": "%1"}
+    assert parses == []
+
+    path.write_text(json.dumps({"active": True, "pane_id": "%22"}), encoding="utf-8")
+    assert gemini_comm._load_project_json(path) == {"active": True, "pane_id": "%22"}
+    assert len(parses) == 1
+
+
+def test_remember_gemini_session_skips_repeated_path(
+    tmp_path: Path, comm: GeminiCommunicator, project_file: Path, upserts: list[dict], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    session = tmp_path / "gemini" / "hash1" / "chats" / "session-1.json"
+    session.parent.mkdir(parents=True)
+    _write_session(session, [])
+
+    comm._remember_gemini_session(session)
+    data = json.loads(project_file.read_text(encoding="utf-8"))
+    assert data["gemini_session_path"] == str(session)
+    assert data["gemini_session_id"] == "s1"
+    assert len(upserts) == 1
+
+    def no_read(path):
+        raise AssertionError("unchanged binding should not re-read the project file")
+
+    monkeypatch.setattr(gemini_comm, "_load_project_json", no_read)
+    comm._remember_gemini_session(session)
+    assert len(upserts) == 1
+
+
+def test_publish_registry_skips_identical_record(comm: GeminiCommunicator, upserts: list[dict]) -> None:
+    record = {"ccb_session_id": "ccb-1", "providers": {"gemini": {"pane_id": "%1"}}}
+    comm._publish_registry(record)
+    comm._publish_registry({"providers": {"gemini": {"pane_id": "%1"}}, "ccb_session_id": "ccb-1"})
+    assert len(upserts) == 1
+    comm._publish_registry({"ccb_session_id": "ccb-1", "providers": {"gemini": {"pane_id": "%2"}}})
+    assert len(upserts) == 2
+
+
+def test_consume_pending_prints_conversations_in_one_write(comm: GeminiCommunicator, capsys) -> None:
+    class _Reader:
+        def current_session_path(self):
+            return None
+
+        def latest_conversations(self, n):
+            return [("q1", "a1"), ("", "a2")]
+
+    comm._log_reader = _Reader()
+    assert comm.consume_pending(n=2) == [("q1", "a1"), ("", "a2")]
+    assert capsys.readouterr().out == "Q: q1\nA: a1\n---\nA: a2\n"
+
+
+def test_health_check_reuses_recent_terminal_probe(tmp_path: Path, comm: GeminiCommunicator) -> None:
+    comm.runtime_dir = tmp_path
+    probes: list[str] = []
+
+    class _Backend:
+        def is_alive(self, pane_id):
+            probes.append(pane_id)
+            return True
+
+        def send_text(self, pane_id, content):
+            raise RuntimeError("pane gone")
+
+    comm.backend = _Backend()
+    assert comm.ping(display=False)[0]
+    assert comm.get_status()["healthy"]
+    assert probes == ["%1"]
+
+    try:
+        comm._send_via_terminal("hi")
+    except RuntimeError:
+        pass
+    comm.ping(display=False)
+    assert probes == ["%1", "%1"]
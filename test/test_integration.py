@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import json
 import os
+import socket
+import socketserver
 import sys
 import time
 import types
@@ -12,6 +14,7 @@ from typing import Any, Callable, Generator
 import pytest
 
 import askd_rpc
+import askd_server
 from askd_client import try_daemon_request
 from askd_server import AskDaemonServer
 from providers import ProviderClientSpec, ProviderDaemonSpec
@@ -104,6 +107,47 @@ def test_daemon_ping_pong(daemon: tuple[ProviderDaemonSpec, Path, Thread]) -> No
     assert askd_rpc.ping_daemon(spec.protocol_prefix, timeout_s=0.5, state_file=state_file) is True
 
 
+@pytest.mark.skipif(not hasattr(socketserver, "ThreadingUnixStreamServer"), reason="no unix sockets")
+def test_daemon_serves_local_unix_socket(daemon: tuple[ProviderDaemonSpec, Path, Thread], tmp_path: Path) -> None:
+    spec, state_file, _thread = daemon
+    st = askd_rpc.read_state(state_file)
+    assert isinstance(st, dict)
+    sock_path = Path(st["unix_socket"])
+    assert (sock_path.stat().st_mode & 0o777) == 0o600
+
+    # Point TCP somewhere dead: the ping must succeed over the unix socket alone.
+    st["port"] = 1
+    st["connect_host"] = st["host"] = "127.0.0.1"
+    unix_only = tmp_path / "unix-only.json"
+    unix_only.write_text(json.dumps(st), encoding="utf-8")
+    assert askd_rpc.ping_daemon(spec.protocol_prefix, timeout_s=0.5, state_file=unix_only) is True
+
+
+def test_daemon_ping_accepts_string_port(daemon: tuple[ProviderDaemonSpec, Path, Thread], tmp_path: Path) -> None:
+    spec, state_file, _thread = daemon
+    st = askd_rpc.read_state(state_file)
+    assert isinstance(st, dict)
+    st["port"] = str(st["port"])
+    st.pop("unix_socket", None)
+    string_port = tmp_path / "string-port.json"
+    string_port.write_text(json.dumps(st), encoding="utf-8")
+    assert askd_rpc.ping_daemon(spec.protocol_prefix, timeout_s=0.5, state_file=string_port) is True
+
+
+def test_daemon_rejects_oversized_request(daemon: tuple[ProviderDaemonSpec, Path, Thread], monkeypatch: pytest.MonkeyPatch) -> None:
+    spec, state_file, _thread = daemon
+    monkeypatch.setattr(askd_server, "_MAX_REQUEST_BYTES", 1024)
+    st = askd_rpc.read_state(state_file)
+    assert isinstance(st, dict)
+    req = {"type": f"{spec.protocol_prefix}.request", "v": 1, "id": "big", "token": st["token"], "message": "x" * 4096}
+    with socket.create_connection((st["connect_host"], int(st["port"])), timeout=2.0) as sock:
+        sock.sendall((json.dumps(req) + "\n").encode("utf-8"))
+        buf = askd_rpc._recv_with_deadline(sock, time.time() + 2.0)
+    resp = json.loads(buf.split(b"\n", 1)[0])
+    assert resp["exit_code"] == 1
+    assert resp["reply"] == "Request too large"
+
+
 def test_daemon_shutdown(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     # Use a dedicated daemon instance for this test so we can shut it down.
     fake_home = tmp_path / "home"
@@ -135,6 +179,41 @@ def test_daemon_shutdown(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Non
     assert askd_rpc.shutdown_daemon(spec.protocol_prefix, timeout_s=0.5, state_file=state_file) is True
     thread.join(timeout=3.0)
     assert askd_rpc.ping_daemon(spec.protocol_prefix, timeout_s=0.2, state_file=state_file) is False
+    assert not state_file.with_suffix(".sock").exists()
+
+
+def test_daemon_idle_timeout_shuts_down(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    fake_home = tmp_path / "home"
+    fake_home.mkdir(parents=True, exist_ok=True)
+    monkeypatch.setenv("HOME", str(fake_home))
+    monkeypatch.setenv("CCB_RUN_DIR", str(tmp_path / "run"))
+    monkeypatch.setenv("CCB_ITEST_IDLE_TIMEOUT_S", "0.4")
+    monkeypatch.delenv("CCB_MANAGED", raising=False)
+    monkeypatch.delenv("CCB_PARENT_PID", raising=False)
+
+    spec = _make_spec()
+    state_file = tmp_path / "state" / "itest.json"
+    state_file.parent.mkdir(parents=True, exist_ok=True)
+
+    def handler(_msg: dict) -> dict:
+        return {"type": f"{spec.protocol_prefix}.response", "v": 1, "id": "x", "exit_code": 0, "reply": "OK"}
+
+    server = AskDaemonServer(
+        spec=spec,
+        host="127.0.0.1",
+        port=0,
+        token="test-token",
+        state_file=state_file,
+        request_handler=handler,
+    )
+    thread = Thread(target=server.serve_forever, name="itest-daemon-idle", daemon=True)
+    thread.start()
+    _wait_for_file(state_file, timeout_s=3.0)
+
+    # Activity pushes the deadline out; afterwards the daemon exits on its own.
+    assert askd_rpc.ping_daemon(spec.protocol_prefix, timeout_s=0.5, state_file=state_file) is True
+    thread.join(timeout=3.0)
+    assert not thread.is_alive()
 
 
 def test_client_try_daemon_request(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
@@ -215,3 +294,43 @@ def test_client_try_daemon_request(tmp_path: Path, monkeypatch: pytest.MonkeyPat
     assert askd_rpc.shutdown_daemon(spec.protocol_prefix, timeout_s=0.5, state_file=state_file) is True
     thread.join(timeout=3.0)
 
+
+
+def test_wait_for_pid_exit_returns_when_process_exits() -> None:
+    import subprocess
+
+    proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(0.2)"])
+    reaper = Thread(target=proc.wait, daemon=True)
+    reaper.start()
+    started = time.monotonic()
+    askd_server._wait_for_pid_exit(proc.pid, poll_interval=0.05)
+    assert time.monotonic() - started < 5.0
+    reaper.join(5.0)
+    assert proc.returncode == 0
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX file modes")
+def test_daemon_state_file_is_private(daemon: tuple[ProviderDaemonSpec, Path, Thread]) -> None:
+    _spec, state_file, _thread = daemon
+    assert (state_file.stat().st_mode & 0o777) == 0o600
+    assert not list(state_file.parent.glob(".*.tmp"))
+
+
+def test_read_state_reuses_parse_until_file_is_replaced(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    state_file = tmp_path / "askd.json"
+    state_file.write_text(json.dumps({"port": 1}), encoding="utf-8")
+    loads: list[str] = []
+    real_loads = json.loads
+    monkeypatch.setattr(askd_rpc.json, "loads", lambda raw: loads.append(raw) or real_loads(raw))
+
+    first = askd_rpc.read_state(state_file)
+    assert first == {"port": 1}
+    first["port"] = 99  # callers get their own copy
+    assert askd_rpc.read_state(state_file) == {"port": 1}
+    assert len(loads) == 1
+
+    tmp = tmp_path / ".askd.json.tmp"
+    tmp.write_text(json.dumps({"port": 2}), encoding="utf-8")
+    os.replace(tmp, state_file)
+    assert askd_rpc.read_state(state_file) == {"port": 2}
+    assert len(loads) == 2
@@ -80,3 +80,31 @@ def test_opencode_session_legacy_session_id_as_storage_id(tmp_path: Path, monkey
     assert session.opencode_session_id == "ses_legacy"
     assert session.opencode_session_id_filter == "ses_legacy"
 
+
+
+def test_oaskd_worker_pool_caches_session_key_by_session_file_stat(tmp_path: Path, monkeypatch) -> None:
+    import os
+
+    import oaskd_daemon
+
+    session_file = tmp_path / ".opencode-session"
+    _write_session(session_file, {"ccb_project_id": "p1", "work_dir": str(tmp_path), "active": True})
+
+    loads: list[Path] = []
+    real_load = oaskd_daemon.load_project_session
+
+    def _tracking_load(work_dir: Path):
+        loads.append(work_dir)
+        return real_load(work_dir)
+
+    monkeypatch.setattr(oaskd_daemon, "load_project_session", _tracking_load)
+    pool = oaskd_daemon._WorkerPool()
+    assert pool._session_key_for(tmp_path) == "opencode:p1"
+    assert pool._session_key_for(tmp_path) == "opencode:p1"
+    assert len(loads) == 1
+
+    _write_session(session_file, {"ccb_project_id": "p22", "work_dir": str(tmp_path), "active": True})
+    st = session_file.stat()
+    os.utime(session_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert pool._session_key_for(tmp_path) == "opencode:p22"
+    assert len(loads) == 2
@@ -136,3 +136,59 @@ def test_load_registry_by_project_id_infers_missing_project_id(tmp_path: Path, m
     rec = load_registry_by_project_id(pid, "codex")
     assert rec is not None
     assert rec.get("ccb_session_id") == "legacy"
+
+
+def test_registry_scan_reparses_only_changed_files(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("USERPROFILE", str(tmp_path))
+    monkeypatch.setattr(pane_registry, "get_backend_for_session", lambda _rec: _FakeBackend(alive={"%1", "%2"}))
+
+    now = int(time.time())
+    _write_registry_file(tmp_path, "a", {"ccb_session_id": "a", "ccb_project_id": "p", "updated_at": now, "providers": {"codex": {"pane_id": "%1"}}})
+    path_b = _write_registry_file(tmp_path, "b", {"ccb_session_id": "b", "ccb_project_id": "q", "updated_at": now, "providers": {"codex": {"pane_id": "%2"}}})
+
+    loads: list[Path] = []
+    real_load = pane_registry._load_registry_file
+
+    def counting_load(path: Path):
+        loads.append(path)
+        return real_load(path)
+
+    monkeypatch.setattr(pane_registry, "_load_registry_file", counting_load)
+    first = load_registry_by_project_id("p", "codex")
+    assert first is not None and first["ccb_session_id"] == "a"
+    assert len(loads) == 2
+
+    # Mutating the result must not leak into the scan cache.
+    first["ccb_project_id"] = "mutated"
+    loads.clear()
+    again = load_registry_by_project_id("p", "codex")
+    assert again is not None and again["ccb_project_id"] == "p"
+    assert loads == []
+
+    _write_registry_file(tmp_path, "b", {"ccb_session_id": "b", "ccb_project_id": "p", "updated_at": now + 1, "providers": {"codex": {"pane_id": "%2"}}})
+    assert load_registry_by_project_id("p", "codex")["ccb_session_id"] == "b"
+    assert loads == [path_b]
+
+
+def test_upsert_registry_concurrent_providers_are_not_lost(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    import threading
+
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("USERPROFILE", str(tmp_path))
+
+    providers = [f"p{i}" for i in range(8)]
+    start = threading.Barrier(len(providers))
+
+    def _register(name: str) -> None:
+        start.wait()
+        upsert_registry({"ccb_session_id": "race", "providers": {name: {"pane_id": f"%{name}"}}})
+
+    threads = [threading.Thread(target=_register, args=(name,)) for name in providers]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(5.0)
+
+    data = json.loads(pane_registry.registry_path_for_session("race").read_text(encoding="utf-8"))
+    assert set(data["providers"]) == set(providers)
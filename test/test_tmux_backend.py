@@ -155,3 +155,14 @@ def test_tmux_kill_pane_prefers_pane_id_over_session(monkeypatch: pytest.MonkeyP
     calls.clear()
     backend.kill_pane("mysession")
     assert calls == [["kill-session", "-t", "mysession"]]
+
+
+def test_tmux_list_pane_liveness_parses_snapshot(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fake_tmux_run(self: terminal.TmuxBackend, args: list[str], *, check: bool = False, capture: bool = False,
+                      input_bytes: bytes | None = None, timeout: float | None = None) -> subprocess.CompletedProcess[str]:
+        assert args == ["list-panes", "-a", "-F", "#{pane_id}\t#{pane_dead}"]
+        return _cp(stdout="%1\t0\n%2\t1\ngarbage\n")
+
+    backend = terminal.TmuxBackend()
+    monkeypatch.setattr(backend, "_tmux_run", fake_tmux_run.__get__(backend, terminal.TmuxBackend))
+    assert backend.list_pane_liveness() == {"%1": True, "%2": False}
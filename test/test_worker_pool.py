@@ -31,6 +31,27 @@ def test_per_session_worker_pool_reuses_same_key() -> None:
     assert started.count("k2") == 1
 
 
+def test_per_session_worker_pool_concurrent_first_use_creates_one_worker() -> None:
+    started: list[str] = []
+    pool: PerSessionWorkerPool[_NoopThread] = PerSessionWorkerPool()
+    barrier = threading.Barrier(8)
+    seen: list[_NoopThread] = []
+
+    def _get() -> None:
+        barrier.wait()
+        seen.append(pool.get_or_create("k1", lambda k: _NoopThread(k, started)))
+
+    threads = [threading.Thread(target=_get) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=2.0)
+
+    assert len(seen) == 8
+    assert all(w is seen[0] for w in seen)
+    assert started == ["k1"]
+
+
 @dataclass
 class _Task:
     req_id: str
@@ -77,3 +98,32 @@ def test_base_session_worker_exception_path() -> None:
         worker.stop()
         worker.join(timeout=2.0)
 
+
+
+def test_base_session_worker_drains_burst_and_stops_promptly() -> None:
+    worker = _EchoWorker("s1")
+    worker.start()
+    tasks = [_Task(req_id=f"r{i}", done_event=threading.Event()) for i in range(20)]
+    for task in tasks:
+        worker.enqueue(task)
+    for task in tasks:
+        assert task.done_event.wait(timeout=2.0) is True
+        assert task.result == f"ok:{task.req_id}"
+
+    started = time.time()
+    worker.stop()
+    worker.join(timeout=2.0)
+    assert not worker.is_alive()
+    assert time.time() - started < 1.0
+
+
+def test_base_session_worker_stop_runs_already_queued_tasks() -> None:
+    worker = _EchoWorker("s1")
+    tasks = [_Task(req_id=f"q{i}", done_event=threading.Event()) for i in range(3)]
+    for task in tasks:
+        worker.enqueue(task)
+    worker.stop()
+    worker.start()
+    worker.join(timeout=2.0)
+    assert not worker.is_alive()
+    assert [t.result for t in tasks] == ["ok:q0", "ok:q1", "ok:q2"]